@@ -1,15 +1,23 @@
 # src/picople/app/controllers/MediaListModel.py
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from functools import partial
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QByteArray
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QPixmap
+
+from picople.infrastructure.thumb_cache import thumb_loader
 
 
 # Roles: ÚNICA FUENTE DE VERDAD
 ROLE_KIND = Qt.UserRole + 1       # "image" | "video"
 ROLE_FAVORITE = Qt.UserRole + 2   # bool
+ROLE_FLAGS = Qt.UserRole + 3      # int con bits FLAG_* (una sola consulta por celda)
+
+FLAG_FAVORITE = 1
+FLAG_VIDEO = 2
+FLAG_HAS_THUMB = 4
 
 
 class MediaListModel(QAbstractListModel):
@@ -17,6 +25,9 @@ class MediaListModel(QAbstractListModel):
         super().__init__(parent)
         self.items: List[Dict[str, Any]] = []
         self.tile_size = int(tile_size)
+        # miniaturas en el pool: llave -> fila que la pidió (pista)
+        self._pending: Dict[str, int] = {}
+        self._failed: Set[str] = set()
 
     # ---------- API ----------
     def set_tile_size(self, sz: int) -> None:
@@ -27,9 +38,11 @@ class MediaListModel(QAbstractListModel):
             self.dataChanged.emit(top_left, bottom_right, [Qt.DecorationRole])
 
     def set_items(self, items: List[Dict[str, Any]]) -> None:
-        # normaliza favorite -> bool
+        # normaliza favorite -> bool; mtime (de la BD) versiona la miniatura
         for it in items:
             it["favorite"] = bool(it.get("favorite", False))
+            it["mtime"] = int(it.get("mtime") or 0)
+        self._failed.clear()
         self.beginResetModel()
         self.items = list(items)
         self.endResetModel()
@@ -40,17 +53,18 @@ class MediaListModel(QAbstractListModel):
         start = len(self.items)
         for it in more:
             it["favorite"] = bool(it.get("favorite", False))
+            it["mtime"] = int(it.get("mtime") or 0)
         self.beginInsertRows(QModelIndex(), start, start + len(more) - 1)
         self.items.extend(more)
         self.endInsertRows()
 
     def set_favorite_by_path(self, path: str, fav: bool) -> None:
-        # actualiza un elemento y emite dataChanged SOLO para ROLE_FAVORITE
+        # actualiza un elemento y emite dataChanged SOLO para favorito (y sus bits)
         for row, it in enumerate(self.items):
             if it.get("path") == path:
                 it["favorite"] = bool(fav)
                 idx = self.index(row, 0)
-                self.dataChanged.emit(idx, idx, [ROLE_FAVORITE])
+                self.dataChanged.emit(idx, idx, [ROLE_FAVORITE, ROLE_FLAGS])
                 break
 
     # ---------- Qt model ----------
@@ -72,10 +86,9 @@ class MediaListModel(QAbstractListModel):
             return it.get("path")
 
         if role == Qt.DecorationRole:
-            pm = self._pixmap_for(it)
-            if pm:
-                return QIcon(pm)
-            return None
+            # QPixmap ya a tamaño tile (el delegate no pasa por QIcon.pixmap);
+            # None mientras el pool la decodifica
+            return self._pixmap_for(it, row)
 
         if role == ROLE_KIND:
             return it.get("kind")
@@ -84,6 +97,12 @@ class MediaListModel(QAbstractListModel):
             # DEVOLVER SIEMPRE bool real
             return bool(it.get("favorite", False))
 
+        if role == ROLE_FLAGS:
+            # se calcula al vuelo: favorite puede cambiar in situ
+            return ((FLAG_FAVORITE if it.get("favorite") else 0)
+                    | (FLAG_VIDEO if it.get("kind") == "video" else 0)
+                    | (FLAG_HAS_THUMB if it.get("thumb_path") else 0))
+
         return None
 
     def roleNames(self) -> dict:  # type: ignore[override]
@@ -92,32 +111,49 @@ class MediaListModel(QAbstractListModel):
             int(Qt.DecorationRole): QByteArray(b"icon"),
             int(ROLE_KIND): QByteArray(b"kind"),
             int(ROLE_FAVORITE): QByteArray(b"favorite"),
+            int(ROLE_FLAGS): QByteArray(b"flags"),
         }
 
     # ---------- Helpers ----------
-    def _pixmap_for(self, it: Dict[str, Any]) -> Optional[QPixmap]:
+    def _pixmap_for(self, it: Dict[str, Any], row: int) -> Optional[QPixmap]:
         # usa thumb si existe, si no intenta cargar el path (cuidado videos)
-        thumb = it.get("thumb_path")
-        path = it.get("path")
         size = self.tile_size or 160
-
-        def _load(p: Optional[str]) -> Optional[QPixmap]:
-            if not p:
-                return None
-            qpm = QPixmap(p)
-            if qpm.isNull():
-                return None
-            if qpm.width() != size or qpm.height() != size:
-                qpm = qpm.scaled(size, size, Qt.KeepAspectRatio,
-                                 Qt.SmoothTransformation)
-            return qpm
-
-        pm = _load(thumb)
-        if pm:
-            return pm
-
+        srcs = [it.get("thumb_path")]
         # último recurso: NO intentes cargar video directo
         if it.get("kind") == "image":
-            return _load(path)
-
+            srcs.append(it.get("path"))
+
+        loader = thumb_loader()
+        for src in srcs:
+            if not src:
+                continue
+            # solo contabilidad (pendiente/fallida); la única caché de pixmaps
+            # es la del loader, con el mtime del item en la llave (sin os.stat)
+            key = f"{src}:{size}"
+            if key in self._failed:
+                continue
+            if key in self._pending:
+                return None
+            # decodifica y escala fuera del hilo GUI; al volver repinta la fila.
+            # thumb_path ya es una miniatura chica: sin sidecar en disco
+            self._pending[key] = row
+            pm = loader.request(
+                src, size, self, partial(self._on_thumb, key, src), crop=False,
+                persist=src != it.get("thumb_path"), mtime=it.get("mtime", 0))
+            if pm is not None:
+                del self._pending[key]
+            return pm
         return None
+
+    def _on_thumb(self, key: str, src: str, pm: QPixmap) -> None:
+        row = self._pending.pop(key, -1)
+        if pm.isNull():
+            self._failed.add(key)
+        # la fila pudo moverse (borrados, recargas): se verifica la pista
+        if not (0 <= row < len(self.items) and src in (
+                self.items[row].get("thumb_path"), self.items[row].get("path"))):
+            row = next((i for i, it in enumerate(self.items)
+                        if src in (it.get("thumb_path"), it.get("path"))), -1)
+        if row >= 0:
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
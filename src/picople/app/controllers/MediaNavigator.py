@@ -22,6 +22,12 @@ class MediaNavigator:
             return self._items[self._i]
         return None
 
+    def peek_next(self) -> Optional[MediaItem]:
+        """Siguiente elemento sin moverse (para precargar)."""
+        if self.has_next():
+            return self._items[self._i + 1]
+        return None
+
     # navegación
     def has_prev(self) -> bool:
         return self._i > 0
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QIcon
+
+
+ROLE_DATA = Qt.UserRole + 100
+
+
+def count_label(photos: int, sugs: int) -> str:
+    if photos > 0:
+        return f"{photos} foto{'s' if photos != 1 else ''}"
+    if sugs > 0:
+        return f"{sugs} sugerencia{'s' if sugs != 1 else ''}"
+    return "0 fotos"
+
+
+class PeopleListModel(QAbstractListModel):
+    """
+    Lista plana de personas/mascotas: rows (dicts) + icons en paralelo.
+    rows: {id, title, is_pet, cover, photos_count, suggestions_count}
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._icons: List[QIcon] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]], icons: List[QIcon]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._icons = list(icons)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_rows([], [])
+
+    def row_data(self, row: int) -> Dict[str, Any]:
+        return self._rows[row]
+
+    def row_for_id(self, pid: str) -> int:
+        for row, data in enumerate(self._rows):
+            if str(data.get("id")) == str(pid):
+                return row
+        return -1
+
+    def update_row(self, row: int, *, icon: Optional[QIcon] = None) -> None:
+        """Notifica cambios del dict de la fila (mutado in situ) y, opcional, su icono."""
+        roles = [Qt.DisplayRole, ROLE_DATA]
+        if icon is not None:
+            self._icons[row] = icon
+            roles.append(Qt.DecorationRole)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, roles)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+
+        if role == Qt.DisplayRole:
+            d = self._rows[row]
+            title = (d.get("title") or "").strip() or "Sin nombre"
+            photos = int(d.get("photos_count", 0))
+            sugs = int(d.get("suggestions_count", 0))
+            return f"{title}\n{count_label(photos, sugs)}"
+        if role == Qt.DecorationRole:
+            return self._icons[row]
+        if role == ROLE_DATA:
+            return self._rows[row]
+
+        return None
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        del self._icons[row:row + count]
+        self.endRemoveRows()
+        return True
@@ -3,6 +3,7 @@ import os
 import shutil
 import subprocess
 import platform
+import threading
 from typing import Optional, List, Dict
 
 from .ProbeResult import ProbeResult
@@ -17,8 +18,25 @@ class SystemProbe:
     """
     Sonda de hardware del sistema.
     Usa una API estática `read()` que devuelve un ProbeResult.
+    `cached()` lo memoriza por proceso: el hardware no cambia entre vistas.
     """
 
+    _cached: Optional[ProbeResult] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def cached(cls, *, refresh: bool = False) -> ProbeResult:
+        """Resultado memorizado; refresh=True vuelve a sondear (p. ej. "Detectar hardware")."""
+        with cls._lock:
+            if refresh or cls._cached is None:
+                cls._cached = cls.read()
+            return cls._cached
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        with cls._lock:
+            cls._cached = None
+
     @staticmethod
     def read() -> ProbeResult:
         cpu = os.cpu_count() or 1
@@ -32,14 +50,17 @@ class SystemProbe:
         # Heurística de sugerencias (conservadora)
         if (ram or 0) >= 24 and cpu >= 8:
             collection_tile = 176
-            batch = 300
-            idx_thumb = 384
         elif (ram or 0) >= 12 and cpu >= 4:
             collection_tile = 160
-            batch = 200
-            idx_thumb = 352
         else:
             collection_tile = 144
+
+        # Lote y miniatura de indexación escalan con la RAM (más RAM → lotes
+        # más grandes); sin dato de RAM nos quedamos en lo mínimo razonable.
+        if ram:
+            batch = max(50, min(ram * 50, 500))
+            idx_thumb = 320 if ram < 8 else 480 if ram < 16 else 640
+        else:
             batch = 150
             idx_thumb = 320
 
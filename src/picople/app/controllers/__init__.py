@@ -1,9 +1,11 @@
 from .MediaListModel import MediaListModel
 from .AlbumListModel import AlbumListModel
+from .PeopleListModel import PeopleListModel
 from .SystemProbe import SystemProbe
 from .ProbeResult import ProbeResult
 from .MediaItem import MediaItem
 from .MediaNavigator import MediaNavigator
 
 __all__ = ["MediaListModel", "SystemProbe",
-           "ProbeResult", "MediaItem", "MediaNavigator", "AlbumListModel"]
+           "ProbeResult", "MediaItem", "MediaNavigator", "AlbumListModel",
+           "PeopleListModel"]
@@ -1,6 +1,6 @@
 import sys
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmapCache
 from PySide6.QtCore import QCoreApplication
 
 from picople.app.main_window import MainWindow
@@ -14,6 +14,9 @@ def main():
     QCoreApplication.setApplicationName("Picople")
 
     app = QApplication(sys.argv)
+    # 64 MB para pixmaps cacheados: una grilla de ~400 miniaturas de 160 px
+    # más avatares cabe sin expulsiones
+    QPixmapCache.setCacheLimit(64 * 1024)
 
     load_orgon_and_set_default(point_size=13)
 
@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QToolButton, QStackedWidget, QSizePolicy, QInputDialog
 )
 
-from picople.core.theme import QSS_DARK, QSS_LIGHT
+from picople.core.theme import QSS_DARK_MIN, QSS_LIGHT_MIN
 from picople.app import views
 from picople.core.config import get_root_dirs
 from picople.infrastructure.indexer import IndexerWorker
@@ -422,7 +422,7 @@ class MainWindow(QMainWindow):
 
     # ---------- helpers ----------
     def _apply_theme(self) -> None:
-        self.setStyleSheet(QSS_DARK if self.dark_mode else QSS_LIGHT)
+        self.setStyleSheet(QSS_DARK_MIN if self.dark_mode else QSS_LIGHT_MIN)
 
     def _update_theme_icon(self) -> None:
         # ícono textual simple para el botón de tema
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import partial
 from typing import Optional, Dict, Any
 
 from PySide6.QtCore import Qt, QSize, QModelIndex
@@ -9,6 +10,7 @@ from PySide6.QtWidgets import (
 )
 
 from picople.infrastructure.db import Database
+from picople.infrastructure.thumb_cache import thumb_loader
 from picople.app.event_bus import bus
 from picople.app.views.SectionView import SectionView
 from picople.app.views.CollectionView import CollectionView
@@ -16,6 +18,25 @@ from picople.app.views.AlbumDetailView import AlbumDetailView
 
 # almacena dict {'id':int|None, 'title':str, 'is_fav':bool}
 ROLE_DATA = Qt.UserRole + 100
+ALBUM_TILE = 192
+
+
+_PLACEHOLDER: Optional[QIcon] = None
+
+
+def _cover_icon(cover: Optional[str]) -> QIcon:
+    """Miniaturas ya pequeñas: QIcon(ruta) y Qt las carga perezosamente al pintar."""
+    return QIcon(cover) if cover else QIcon()
+
+
+def _placeholder_icon() -> QIcon:
+    """Relleno compartido mientras el pool decodifica una portada."""
+    global _PLACEHOLDER
+    if _PLACEHOLDER is None:
+        pm = QPixmap(ALBUM_TILE, ALBUM_TILE)
+        pm.fill(Qt.darkGray)
+        _PLACEHOLDER = QIcon(pm)
+    return _PLACEHOLDER
 
 
 class AlbumsView(SectionView):
@@ -23,6 +44,8 @@ class AlbumsView(SectionView):
         super().__init__("Álbumes", "Organizados automáticamente por carpetas.",
                          compact=True, show_header=True)
         self.db = db
+        # original que se decodifica para la portada de "Favoritos"
+        self._fav_cover_src: Optional[str] = None
 
         self.stack = QStackedWidget()
         self._page_list = QWidget()
@@ -53,7 +76,7 @@ class AlbumsView(SectionView):
         self.list.setSpacing(16)
         self.list.setResizeMode(QListView.Adjust)
         self.list.setMovement(QListView.Static)
-        self.list.setIconSize(QSize(192, 192))
+        self.list.setIconSize(QSize(ALBUM_TILE, ALBUM_TILE))
         self.list.setUniformItemSizes(False)
         self.list.doubleClicked.connect(self._open_album)
 
@@ -63,6 +86,7 @@ class AlbumsView(SectionView):
 
     def _reload_list(self):
         self.model.clear()
+        self._fav_cover_src = None
         if not self.db or not self.db.is_open:
             return
 
@@ -71,10 +95,12 @@ class AlbumsView(SectionView):
         if fav_count > 0:
             last = self.db.fetch_media_page(
                 offset=0, limit=1, favorites_only=True, order_by="mtime DESC")
-            cover = (last[0].get("thumb_path")
-                     or last[0].get("path")) if last else None
-            pm = QPixmap(cover) if cover else QPixmap()
-            it = QStandardItem(QIcon(pm), f"Favoritos  ({fav_count})")
+            thumb = last[0].get("thumb_path") if last else None
+            if thumb:
+                icon = _cover_icon(thumb)
+            else:
+                icon = self._fav_cover_icon(last[0] if last else None)
+            it = QStandardItem(icon, f"Favoritos  ({fav_count})")
             it.setData({"id": None, "title": "Favoritos",
                        "is_fav": True}, ROLE_DATA)
             it.setEditable(False)
@@ -84,9 +110,9 @@ class AlbumsView(SectionView):
         for a in self.db.list_albums():
             title = a["title"]
             count = a["count"]
-            cover = a.get("cover_path")
-            pm = QPixmap(cover) if cover else QPixmap()
-            it = QStandardItem(QIcon(pm), f"{title}  ({count})")
+            # cover_path de un álbum es la miniatura de uno de sus medios
+            it = QStandardItem(
+                _cover_icon(a.get("cover_path")), f"{title}  ({count})")
             it.setData({"id": a["id"], "title": title,
                        "is_fav": False}, ROLE_DATA)
             it.setEditable(False)
@@ -94,11 +120,33 @@ class AlbumsView(SectionView):
 
         # grid agradable a texto: alto para título+conteo
         fm = self.list.fontMetrics()
-        tile = 192
+        tile = ALBUM_TILE
         cell_h = 12 + tile + 8 + fm.height() + 8
         cell_w = 10 + tile + 10
         self.list.setGridSize(QSize(cell_w, int(cell_h)))
 
+    def _fav_cover_icon(self, media: Optional[Dict[str, Any]]) -> QIcon:
+        # sin miniatura: el original se reduce en el pool, no en el hilo GUI
+        src = media.get("path") if media else None
+        if not src:
+            return QIcon()
+        self._fav_cover_src = src
+        pm = thumb_loader().request(
+            src, ALBUM_TILE, self, partial(self._on_fav_cover, src), crop=False,
+            mtime=media.get("mtime"))
+        if pm is None:
+            return _placeholder_icon()
+        return QIcon(pm) if not pm.isNull() else QIcon()
+
+    def _on_fav_cover(self, src: str, pm: QPixmap):
+        # la lista pudo recargarse mientras tanto: solo si sigue siendo su portada
+        if src != self._fav_cover_src:
+            return
+        item = self.model.item(0)
+        data = item.data(ROLE_DATA) if item is not None else None
+        if data and data.get("is_fav"):
+            item.setIcon(QIcon(pm) if not pm.isNull() else QIcon())
+
     def _open_album(self, idx: QModelIndex):
         data: Dict[str, Any] = idx.data(ROLE_DATA)
         if not data:
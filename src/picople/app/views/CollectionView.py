@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Optional
 
-from PySide6.QtCore import QSize, QModelIndex
+from PySide6.QtCore import QSize, QModelIndex, QTimer
 from PySide6.QtWidgets import (
     QHBoxLayout, QListView, QComboBox, QLineEdit, QToolButton, QLabel, QApplication
 )
@@ -83,7 +83,8 @@ class CollectionView(SectionView):
 
         tile = int(self.model.tile_size)
         self.delegate = ThumbDelegate(
-            tile=tile, text_lines=0, parent=self.view)
+            tile=tile, text_lines=0, parent=self.view,
+            show_fav=True, show_video_badge=True)
         self.view.setItemDelegate(self.delegate)
 
         fm = self.view.fontMetrics()
@@ -108,6 +109,16 @@ class CollectionView(SectionView):
         self.btn_reload.clicked.connect(self._on_filters_changed)
         self.view.verticalScrollBar().valueChanged.connect(self._maybe_fetch_more)
 
+        # Scroll activo: el delegate escala en modo rápido hasta que se detiene
+        self._scroll_idle = QTimer(self)
+        self._scroll_idle.setSingleShot(True)
+        self._scroll_idle.setInterval(150)
+        self._scroll_idle.timeout.connect(self._on_scroll_idle)
+        sb = self.view.verticalScrollBar()
+        sb.valueChanged.connect(self._on_scroll_activity)
+        sb.sliderPressed.connect(self._on_scroll_activity)
+        sb.sliderReleased.connect(self._scroll_idle.start)
+
         # Escucha cambios de favoritos en toda la app
         bus.favoriteChanged.connect(self._on_fav_changed)
 
@@ -171,6 +182,16 @@ class CollectionView(SectionView):
         if sb.maximum() - value <= 80:
             self._fetch_more(initial=False)
 
+    def _on_scroll_activity(self, *_):
+        self.view.setProperty("scrolling", True)
+        if not self.view.verticalScrollBar().isSliderDown():
+            self._scroll_idle.start()
+
+    def _on_scroll_idle(self):
+        self.view.setProperty("scrolling", False)
+        # repinta lo visible con el escalado suave
+        self.view.viewport().update()
+
     def _search_text(self) -> Optional[str]:
         t = self.txt_search.text().strip()
         return t or None
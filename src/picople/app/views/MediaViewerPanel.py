@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import List, Optional
 from pathlib import Path
 
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QStackedWidget, QToolBar, QToolButton,
     QLabel, QStatusBar, QSlider
@@ -33,6 +33,14 @@ class MediaViewerPanel(QWidget):
         self.db: Optional[Database] = db
         self._seeking = False
 
+        # Posición de video coalescida (~30 Hz): el player emite más seguido
+        # de lo que vale la pena repintar el slider
+        self._last_pos_ms = 0
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.setInterval(33)
+        self._pos_timer.timeout.connect(self._flush_pos)
+
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
@@ -241,6 +249,11 @@ class MediaViewerPanel(QWidget):
             self.stack.setCurrentIndex(1)
             self._apply_mode("video")
 
+        # navegación secuencial: deja listo el siguiente video
+        nxt = self.nav.peek_next()
+        if nxt is not None and nxt.kind == "video":
+            self.video_view.preload_path(nxt.path)
+
         fav = None
         try:
             if self.db and self.db.is_open:
@@ -302,11 +315,19 @@ class MediaViewerPanel(QWidget):
         self.video_view.set_volume(v)
 
     def _on_video_pos(self, pos_ms: int):
+        self._last_pos_ms = pos_ms
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+
+    def _flush_pos(self):
+        pos_ms = self._last_pos_ms
         if not self._seeking:
             self.pos_slider.setValue(pos_ms)
         dur = self.pos_slider.maximum()
-        self.lbl_time.setText(
-            f"{self._fmt_time(pos_ms)} / {self._fmt_time(dur)}")
+        text = f"{self._fmt_time(pos_ms)} / {self._fmt_time(dur)}"
+        # el texto cambia una vez por segundo; evita relayout del label
+        if text != self.lbl_time.text():
+            self.lbl_time.setText(text)
 
     def _on_video_dur(self, dur_ms: int):
         self.pos_slider.setRange(0, max(0, dur_ms))
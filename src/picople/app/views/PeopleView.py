@@ -3,21 +3,40 @@ from typing import Dict, Any, Optional, List
 
 from PySide6.QtCore import Qt, QSize, QModelIndex, QPoint, QTimer
 from PySide6.QtGui import (
-    QIcon, QPixmap, QPainter, QPainterPath, QStandardItem, QStandardItemModel, QImageReader
+    QIcon, QPixmap, QPainter, QImage, QImageReader
 )
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QListView, QStackedWidget, QToolButton,
     QLabel, QStyle, QMenu, QInputDialog
 )
 
+from picople.app.controllers import PeopleListModel
+from picople.app.controllers.PeopleListModel import ROLE_DATA
 from picople.infrastructure.db import Database
 from picople.infrastructure.people_store import PeopleStore
 from .SectionView import SectionView
 from .PersonDetailView import PersonDetailView
 
-ROLE_DATA = Qt.UserRole + 100
 TILE = 128
 
+_CIRCLE_MASK: Optional[QImage] = None
+
+
+def _circle_mask() -> QImage:
+    # máscara circular Alpha8 compartida; se construye una sola vez
+    global _CIRCLE_MASK
+    if _CIRCLE_MASK is None:
+        mask = QImage(TILE, TILE, QImage.Format_Alpha8)
+        mask.fill(0)
+        p = QPainter(mask)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setPen(Qt.NoPen)
+        p.setBrush(Qt.black)
+        p.drawEllipse(0, 0, TILE, TILE)
+        p.end()
+        _CIRCLE_MASK = mask
+    return _CIRCLE_MASK
+
 
 class PeopleView(SectionView):
     """
@@ -46,6 +65,7 @@ class PeopleView(SectionView):
 
         self._clusters_mock: list[Dict[str, Any]] = self._mock_clusters()
         self._current_person_id: Optional[str] = None
+        self._ctx_menu: Optional[QMenu] = None
 
         self._build_list_page()
         self._build_detail_page()
@@ -78,57 +98,75 @@ class PeopleView(SectionView):
         self.list.setResizeMode(QListView.Adjust)
         self.list.setMovement(QListView.Static)
         self.list.setIconSize(QSize(TILE, TILE))
-        self.list.setUniformItemSizes(False)
+        # Todas las celdas miden lo mismo: tamaño fijo antes de insertar filas
+        # y layout por lotes, sin medir ítem por ítem.
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setBatchSize(64)
         self.list.setWordWrap(True)
+        fm = self.list.fontMetrics()
+        two_lines = fm.height() * 2 + 6
+        cell_h = 12 + TILE + 8 + two_lines + 8
+        cell_w = 10 + TILE + 10
+        self.list.setGridSize(QSize(cell_w, int(cell_h)))
         self.list.doubleClicked.connect(self._on_double_clicked)
 
         # menú contextual
         self.list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list.customContextMenuRequested.connect(self._open_context_menu)
 
-        self.model = QStandardItemModel(self.list)
+        self.model = PeopleListModel(self.list)
         self.list.setModel(self.model)
 
         root.addWidget(self.list, 1)
 
     # ——— helpers de imagen ———
-    def _load_pixmap_fresh(self, path: str | None) -> QPixmap:
+    def _load_image_fresh(self, path: str | None) -> QImage:
         """Carga la imagen ignorando cachés del SO/Qt para ver cambios de disco."""
         if not path:
-            pm = QPixmap(TILE, TILE)
-            pm.fill(Qt.darkGray)
-            return pm
+            img = QImage(TILE, TILE, QImage.Format_ARGB32_Premultiplied)
+            img.fill(Qt.darkGray)
+            return img
         reader = QImageReader(path)
         reader.setAutoTransform(True)
+        # el decodificador entrega ya ~TILE px (JPEG escala en el dominio DCT)
+        orig = reader.size()
+        if orig.isValid():
+            reader.setScaledSize(
+                orig.scaled(TILE, TILE, Qt.KeepAspectRatioByExpanding))
         img = reader.read()
         if img.isNull():
-            pm = QPixmap(TILE, TILE)
-            pm.fill(Qt.darkGray)
-            return pm
-        return QPixmap.fromImage(img)
+            img = QImage(TILE, TILE, QImage.Format_ARGB32_Premultiplied)
+            img.fill(Qt.darkGray)
+        return img
+
+    # icono de "sin portada": igual para todas las filas, se rasteriza una vez
+    _FALLBACK_ICON: Optional[QIcon] = None
+
+    def _person_icon(self, cover_path: str | None) -> QIcon:
+        if cover_path:
+            return QIcon(self._circular_pixmap(cover_path))
+        if PeopleView._FALLBACK_ICON is None:
+            PeopleView._FALLBACK_ICON = QIcon(self._circular_pixmap(None))
+        return PeopleView._FALLBACK_ICON
 
     def _circular_pixmap(self, cover_path: str | None) -> QPixmap:
         size = TILE
-        base = self._load_pixmap_fresh(cover_path)
+        base = self._load_image_fresh(cover_path)
         base = base.scaled(
             size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        pm = QPixmap(size, size)
-        pm.fill(Qt.transparent)
-        painter = QPainter(pm)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        path = QPainterPath()
-        path.addEllipse(0, 0, size, size)
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, base)
+        # Composición en CPU sobre el formato nativo del raster; una sola
+        # subida a QPixmap al final.
+        img = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        img.fill(Qt.transparent)
+        painter = QPainter(img)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.drawImage(0, 0, base)
+        # recorte por composición con la máscara, sin rasterizar un path
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, _circle_mask())
         painter.end()
-        return pm
-
-    def _count_label(self, photos: int, sugs: int) -> str:
-        if photos > 0:
-            return f"{photos} foto{'s' if photos != 1 else ''}"
-        if sugs > 0:
-            return f"{sugs} sugerencia{'s' if sugs != 1 else ''}"
-        return "0 fotos"
+        return QPixmap.fromImage(img)
 
     def _reload_list(self) -> None:
         """Carga desde DB si hay store; si no, usa mock."""
@@ -150,6 +188,8 @@ class PeopleView(SectionView):
         else:
             persons = self._clusters_mock
 
+        rows: List[Dict[str, Any]] = []
+        icons: List[QIcon] = []
         for p in persons:
             pid = int(p.get("id", 0))
             cover = p.get("cover") or ""
@@ -164,31 +204,16 @@ class PeopleView(SectionView):
                 except Exception:
                     pass
 
-            icon = QIcon(self._circular_pixmap(cover))
-            title = (p.get("title") or "").strip() or "Sin nombre"
-            photos = int(p.get("photos", 0))
-            sugs = int(p.get("suggestions_count", 0))
-            text = f"{title}\n{self._count_label(photos, sugs)}"
-
-            it = QStandardItem(icon, text)
-            it.setEditable(False)
-            it.setData({
+            icons.append(self._person_icon(cover))
+            rows.append({
                 "id": pid,
-                "title": title,
+                "title": (p.get("title") or "").strip() or "Sin nombre",
                 "is_pet": bool(p.get("is_pet")),
                 "cover": cover,
-                "photos_count": photos,
-                "suggestions_count": sugs
-            }, ROLE_DATA)
-            self.model.appendRow(it)
-
-        fm = self.list.fontMetrics()
-        two_lines = fm.height() * 2 + 6
-        cell_h = 12 + TILE + 8 + two_lines + 8
-        cell_w = 10 + TILE + 10
-        self.list.setGridSize(QSize(cell_w, int(cell_h)))
-        QTimer.singleShot(
-            0, lambda: self.list.setGridSize(self.list.gridSize()))
+                "photos_count": int(p.get("photos", 0)),
+                "suggestions_count": int(p.get("suggestions_count", 0))
+            })
+        self.model.set_rows(rows, icons)
 
     # ──────────────────────── Detail page ────────────────────────
     def _build_detail_page(self) -> None:
@@ -253,17 +278,27 @@ class PeopleView(SectionView):
         else:
             detail = PersonDetailView(cluster=data, parent=self._page_detail)
 
-        detail.suggestionCountChanged.connect(
-            lambda n, _pid=pid: self._update_person_label(_pid, n))
-        detail.titleChanged.connect(
-            lambda new_title, _pid=pid: self._apply_title_change(_pid, new_title))
-        detail.coverChanged.connect(
-            lambda _pid=pid: self._refresh_person_icon(_pid))
+        # solo hay un detalle abierto: su persona es _current_person_id
+        detail.suggestionCountChanged.connect(self._on_detail_sug_count)
+        detail.titleChanged.connect(self._on_detail_title)
+        detail.coverChanged.connect(self._on_detail_cover)
 
         self.detail_container.addWidget(detail)
         self.detail_container.setCurrentWidget(detail)
         self.stack.setCurrentIndex(1)
 
+    def _on_detail_sug_count(self, n: int) -> None:
+        if self._current_person_id is not None:
+            self._update_person_label(self._current_person_id, n)
+
+    def _on_detail_title(self, new_title: str) -> None:
+        if self._current_person_id is not None:
+            self._apply_title_change(self._current_person_id, new_title)
+
+    def _on_detail_cover(self) -> None:
+        if self._current_person_id is not None:
+            self._refresh_person_icon(self._current_person_id)
+
     # ─────────────────────── Menú contextual ───────────────────────
     def _open_context_menu(self, pos: QPoint) -> None:
         idx = self.list.indexAt(pos)
@@ -274,31 +309,37 @@ class PeopleView(SectionView):
         if pid is None:
             return
 
-        menu = QMenu(self)
-        act_rename = menu.addAction("Renombrar…")
-        if bool(data.get("is_pet")):
-            act_pet = menu.addAction("Marcar como persona")
-        else:
-            act_pet = menu.addAction("Marcar como mascota")
-        menu.addSeparator()
-        act_fix = menu.addAction("Reparar portada (zoom rostro)")
-        menu.addSeparator()
-        act_delete = menu.addAction("Eliminar")
+        menu = self._person_menu()
+        self._act_pet.setText(
+            "Marcar como persona" if bool(data.get("is_pet")) else "Marcar como mascota")
 
         global_pos = self.list.viewport().mapToGlobal(pos)
         act = menu.exec(global_pos)
         if not act:
             return
 
-        if act == act_rename:
+        if act is self._act_rename:
             self._rename_person(idx)
-        elif act == act_pet:
+        elif act is self._act_pet:
             self._toggle_pet(idx)
-        elif act == act_fix:
+        elif act is self._act_fix:
             self._force_fix_cover(pid)
-        elif act == act_delete:
+        elif act is self._act_delete:
             self._delete_person(idx)
 
+    def _person_menu(self) -> QMenu:
+        """Menú contextual único; se construye en el primer clic derecho."""
+        if self._ctx_menu is None:
+            menu = QMenu(self)
+            self._act_rename = menu.addAction("Renombrar…")
+            self._act_pet = menu.addAction("Marcar como mascota")
+            menu.addSeparator()
+            self._act_fix = menu.addAction("Reparar portada (zoom rostro)")
+            menu.addSeparator()
+            self._act_delete = menu.addAction("Eliminar")
+            self._ctx_menu = menu
+        return self._ctx_menu
+
     def _force_fix_cover(self, pid: int) -> None:
         if not self.store:
             return
@@ -310,22 +351,13 @@ class PeopleView(SectionView):
 
     # ─────────────────────── utilidades modelo ───────────────────────
     def _find_model_row_by_person_id(self, pid: str) -> int:
-        for row in range(self.model.rowCount()):
-            data = self.model.item(row).data(ROLE_DATA)
-            if data and str(data.get("id")) == str(pid):
-                return row
-        return -1
+        return self.model.row_for_id(pid)
 
     def _update_person_label(self, pid: str, _new_sug_count: int) -> None:
         row = self._find_model_row_by_person_id(pid)
         if row < 0:
             return
-        it = self.model.item(row)
-        data: Dict[str, Any] = it.data(ROLE_DATA)
-        photos = int(data.get("photos_count", 0))
-        sugs = int(data.get("suggestions_count", 0))
-        title = (data.get("title") or "").strip() or "Sin nombre"
-        it.setText(f"{title}\n{self._count_label(photos, sugs)}")
+        self.model.update_row(row)
 
     def _refresh_person_icon(self, pid: str) -> None:
         if self.store is None:
@@ -333,8 +365,7 @@ class PeopleView(SectionView):
         row = self._find_model_row_by_person_id(pid)
         if row < 0:
             return
-        it = self.model.item(row)
-        data: Dict[str, Any] = it.data(ROLE_DATA) or {}
+        data: Dict[str, Any] = self.model.row_data(row)
         try:
             persons = self.store.list_persons_overview(include_zero=True)
             match = next((p for p in persons if str(
@@ -342,26 +373,18 @@ class PeopleView(SectionView):
         except Exception:
             match = None
         cover = (match or {}).get("cover") or data.get("cover") or ""
-        it.setIcon(QIcon(self._circular_pixmap(cover)))
         data["cover"] = cover
-        it.setData(data, ROLE_DATA)
+        self.model.update_row(row, icon=self._person_icon(cover))
 
     def _apply_title_change(self, pid: str, new_title: str) -> None:
         row = self._find_model_row_by_person_id(pid)
         if row < 0:
             return
-        it = self.model.item(row)
-        data: Dict[str, Any] = it.data(ROLE_DATA)
-        data["title"] = new_title
-        photos = int(data.get("photos_count", 0))
-        sugs = int(data.get("suggestions_count", 0))
-        base = new_title.strip() or "Sin nombre"
-        it.setText(f"{base}\n{self._count_label(photos, sugs)}")
-        it.setData(data, ROLE_DATA)
+        self.model.row_data(row)["title"] = new_title
+        self.model.update_row(row)
 
     def _rename_person(self, idx: QModelIndex) -> None:
-        it = self.model.itemFromIndex(idx)
-        data: Dict[str, Any] = it.data(ROLE_DATA) or {}
+        data: Dict[str, Any] = self.model.row_data(idx.row())
         old = (data.get("title") or "").strip()
         new, ok = QInputDialog.getText(
             self, "Renombrar persona/mascota", "", text=old)
@@ -374,15 +397,10 @@ class PeopleView(SectionView):
             except Exception:
                 pass
         data["title"] = title
-        photos = int(data.get("photos_count", 0))
-        sugs = int(data.get("suggestions_count", 0))
-        base = title if title else "Sin nombre"
-        it.setText(f"{base}\n{self._count_label(photos, sugs)}")
-        it.setData(data, ROLE_DATA)
+        self.model.update_row(idx.row())
 
     def _toggle_pet(self, idx: QModelIndex) -> None:
-        it = self.model.itemFromIndex(idx)
-        data: Dict[str, Any] = it.data(ROLE_DATA) or {}
+        data: Dict[str, Any] = self.model.row_data(idx.row())
         new_flag = not bool(data.get("is_pet"))
         if self.store:
             try:
@@ -390,11 +408,10 @@ class PeopleView(SectionView):
             except Exception:
                 pass
         data["is_pet"] = new_flag
-        it.setData(data, ROLE_DATA)
+        self.model.update_row(idx.row())
 
     def _delete_person(self, idx: QModelIndex) -> None:
-        it = self.model.itemFromIndex(idx)
-        data: Dict[str, Any] = it.data(ROLE_DATA) or {}
+        data: Dict[str, Any] = self.model.row_data(idx.row())
         pid = data.get("id")
         if pid is None:
             return
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import Optional
 
 from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath
+from PySide6.QtGui import QPixmap, QPainter, QBrush, QImageReader
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QToolButton, QStyle
 
 
@@ -64,7 +64,7 @@ class PersonDetailHeader(QWidget):
 
         # Imagen o placeholder
         if cover:
-            src = QPixmap(cover)
+            src = self._read_bounded(cover, size_px)
             if not src.isNull():
                 src = src.scaled(
                     size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
@@ -76,20 +76,14 @@ class PersonDetailHeader(QWidget):
         else:
             src = self._placeholder(size_px, kind)
 
-        # máscara circular
-        path = QPainterPath()
-        path.addEllipse(0, 0, size.width(), size.height())
-
+        # Círculo relleno con la imagen como textura: una pasada, sin clip
         painter = QPainter(pm)
-        painter.setRenderHints(QPainter.Antialiasing |
-                               QPainter.SmoothPixmapTransform)
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, src)
-        painter.end()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(src))
+        painter.drawEllipse(0, 0, size.width(), size.height())
 
         # borde sutil
-        painter = QPainter(pm)
-        painter.setRenderHint(QPainter.Antialiasing)
         pen_col = self.palette().windowText().color()
         pen_col.setAlpha(60)
         painter.setPen(pen_col)
@@ -99,6 +93,17 @@ class PersonDetailHeader(QWidget):
 
         return pm
 
+    def _read_bounded(self, path: str, size_px: int) -> QPixmap:
+        """Decodifica la portada a ~2× el avatar, no a resolución completa."""
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        orig = reader.size()
+        if orig.isValid():
+            box = 2 * size_px
+            reader.setScaledSize(
+                orig.scaled(box, box, Qt.KeepAspectRatioByExpanding))
+        return QPixmap.fromImage(reader.read())
+
     def _placeholder(self, size_px: int, kind: str) -> QPixmap:
         sp = QStyle.SP_DirIcon if kind == "person" else QStyle.SP_DriveDVDIcon
         icon_pm = self.style().standardIcon(sp).pixmap(
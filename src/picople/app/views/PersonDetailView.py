@@ -1,17 +1,81 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+import os
+from functools import partial
+from typing import Dict, Any, Iterable, List, Optional
 
-from PySide6.QtCore import Qt, Signal, QSize, QRect, QTimer
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QAction
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
+from PySide6.QtGui import (
+    QPixmap, QPainter, QAction, QImage, QImageReader, QPixmapCache
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QToolButton, QStackedWidget,
     QScrollArea, QGridLayout, QFrame, QInputDialog, QMenu
 )
 
 from picople.infrastructure.people_store import PeopleStore
+from picople.infrastructure.thumb_cache import thumb_loader
+from .SectionView import make_placeholder
 from .SuggestionTile import SuggestionTile
 
 TILE = 160
+FACE_TILE = 140
+AVATAR = 40
+
+
+_EMPTY_FACES: Dict[int, QPixmap] = {}
+
+
+def _empty_face(size: int) -> QPixmap:
+    # relleno compartido para miniaturas ilegibles en "Todos"
+    pm = _EMPTY_FACES.get(size)
+    if pm is None:
+        pm = QPixmap(size, size)
+        pm.fill(Qt.darkGray)
+        _EMPTY_FACES[size] = pm
+    return pm
+
+
+def _avatar_cache_key(cover_path: Optional[str], px: int) -> str:
+    # kind separa portada real de relleno; el mtime entra en la llave porque
+    # regenerar la portada reescribe el mismo archivo
+    if cover_path:
+        try:
+            mtime = os.stat(cover_path).st_mtime_ns
+            return f"avatar:{cover_path}:{px}:cover:{mtime}"
+        except OSError:
+            pass
+    return f"avatar::{px}:fallback"
+
+
+def _read_scaled(path: str, box: int) -> QImage:
+    """Decodifica ya reducido a ~box px (cubriendo) en lugar de a resolución completa."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    src_size = reader.size()
+    if src_size.isValid():
+        reader.setScaledSize(
+            src_size.scaled(box, box, Qt.KeepAspectRatioByExpanding))
+    return reader.read()
+
+
+_AVATAR_MASKS: Dict[int, QImage] = {}
+
+
+def _avatar_mask(px: int) -> QImage:
+    # máscara circular Alpha8 compartida por tamaño en píxeles físicos;
+    # se construye una sola vez (requiere QGuiApplication)
+    mask = _AVATAR_MASKS.get(px)
+    if mask is None:
+        mask = QImage(px, px, QImage.Format_Alpha8)
+        mask.fill(0)
+        p = QPainter(mask)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setPen(Qt.NoPen)
+        p.setBrush(Qt.black)
+        p.drawEllipse(0, 0, px, px)
+        p.end()
+        _AVATAR_MASKS[px] = mask
+    return mask
 
 
 class PersonDetailView(QWidget):
@@ -19,6 +83,14 @@ class PersonDetailView(QWidget):
     titleChanged = Signal(str)
     coverChanged = Signal()
 
+    # SuggestionTile.tileAction -> slot
+    _SUG_DISPATCH = {
+        "accept": "_on_accept",
+        "reject": "_on_reject",
+        "discard": "_on_discard",
+        "cover": "_on_set_cover",
+    }
+
     def __init__(
         self,
         cluster: Optional[Dict[str, Any]] = None,
@@ -35,15 +107,36 @@ class PersonDetailView(QWidget):
         self.person_title = person_title or (
             cluster.get("title") if cluster else "Sin nombre")
 
-        self._sugs: List[Dict[str, Any]] = []
+        # id (str) -> sugerencia; el dict conserva el orden de inserción
+        self._sugs: Dict[str, Dict[str, Any]] = {}
+        self._sug_tiles: Dict[str, SuggestionTile] = {}
+        # página -> columnas con las que se construyó (ausente = sin construir)
+        self._built_cols: Dict[QWidget, int] = {}
+        self._has_all = False
+        self._sugs_fetched = False
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.setInterval(140)
         self._resize_timer.timeout.connect(self._rebuild_visible)
 
-        root = QVBoxLayout(self)
-        root.setContentsMargins(16, 12, 16, 12)
-        root.setSpacing(10)
+        self._root = QVBoxLayout(self)
+        self._root.setContentsMargins(16, 12, 16, 12)
+        self._root.setSpacing(10)
+
+        # El resto del árbol se construye en el primer showEvent: una vista
+        # creada y nunca mostrada solo cuesta estos atributos.
+        self._built = False
+
+    def showEvent(self, e):
+        self._ensure_built()
+        super().showEvent(e)
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
+        root = self._root
+        cluster = self.cluster
 
         # Header
         hdr = QVBoxLayout()
@@ -54,7 +147,7 @@ class PersonDetailView(QWidget):
         top.setSpacing(8)
 
         self.lbl_avatar = QLabel(self)
-        self.lbl_avatar.setFixedSize(40, 40)
+        self.lbl_avatar.setFixedSize(AVATAR, AVATAR)
         self._set_avatar((cluster or {}).get("cover") if cluster else None)
 
         self.lbl_title = QLabel(self.person_title, self)
@@ -119,56 +212,66 @@ class PersonDetailView(QWidget):
         la.addWidget(self.scroll_all, 1)
         self.stack.addWidget(self.page_all)
 
+        # Página de sugerencias: solo el contenedor; el scroll y la grilla
+        # se crean la primera vez que se muestra (_ensure_sugs_page).
         self.page_sugs = QWidget(self)
-        ls = QVBoxLayout(self.page_sugs)
-        ls.setContentsMargins(0, 0, 0, 0)
-        ls.setSpacing(0)
-        self.scroll = QScrollArea(self.page_sugs)
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setFrameShape(QFrame.NoFrame)
-        self.grid_host = QWidget(self.scroll)
-        self.grid = QGridLayout(self.grid_host)
-        self.grid.setContentsMargins(0, 0, 0, 0)
-        self.grid.setHorizontalSpacing(12)
-        self.grid.setVerticalSpacing(12)
-        self.scroll.setWidget(self.grid_host)
-        ls.addWidget(self.scroll, 1)
+        self.scroll: Optional[QScrollArea] = None
+        self.grid: Optional[QGridLayout] = None
         self.stack.addWidget(self.page_sugs)
 
-        # Estado inicial
-        self._load_all()
-        self._load_suggestions()
+        self.btn_sugs.setText("Sugerencias")
+        self.stack.currentChanged.connect(self._on_page_changed)
+        self.show_all()
+
+        # Las consultas a la DB van después de que la vista se muestre:
+        # la conexión SQLCipher pertenece al hilo GUI, así que no se mueven
+        # a otro hilo, pero ya no bloquean la apertura del detalle.
+        QTimer.singleShot(0, self._initial_load)
+
+    def _initial_load(self):
+        # Solo se construye la página visible; de las sugerencias basta
+        # con los datos para el contador del enlace.
+        if self.page_all not in self._built_cols:
+            self._load_all()
+        if self.page_sugs not in self._built_cols:
+            self._fetch_suggestions()
+        self._update_sug_link_text()
 
         # Si no hay “Todos” pero sí sugerencias, muestra sugerencias
-        has_all = self._grid_all.count() > 0 and self._grid_all.itemAt(0).widget() is not None
-        if not has_all and len(self._sugs) > 0:
+        if not self._has_all and len(self._sugs) > 0:
             self.show_suggestions()
-        else:
-            self.show_all()
 
     def is_on_suggestions(self) -> bool:
-        return self.stack.currentWidget() is self.page_sugs
+        return self._built and self.stack.currentWidget() is self.page_sugs
 
     def _set_avatar(self, cover_path: Optional[str]):
-        size = 40
-        pm = QPixmap(size, size)
-        pm.fill(Qt.transparent)
-        painter = QPainter(pm)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        path = QPainterPath()
-        path.addEllipse(QRect(0, 0, size, size))
-        painter.setClipPath(path)
-        if cover_path:
-            src = QPixmap(cover_path)
-            if not src.isNull():
-                src = src.scaled(
-                    size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                painter.drawPixmap(0, 0, src)
-            else:
-                painter.fillRect(0, 0, size, size, Qt.gray)
+        # tamaño en píxeles físicos: en HiDPI no se reescala ni se regenera
+        dpr = self.devicePixelRatioF()
+        px = max(1, round(AVATAR * dpr))
+        key = _avatar_cache_key(cover_path, px)
+        cached = QPixmapCache.find(key)
+        if cached is not None:
+            self.lbl_avatar.setPixmap(cached)
+            return
+        # Formato nativo del raster (premultiplicado): sin conversión al
+        # blitear; el círculo sale de la máscara, sin teselar un path.
+        img = QImage(px, px, QImage.Format_ARGB32_Premultiplied)
+        img.fill(0)
+        painter = QPainter(img)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        src = _read_scaled(cover_path, 2 * px) if cover_path else QImage()
+        if not src.isNull():
+            src = src.scaled(
+                px, px, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            painter.drawImage(0, 0, src)
         else:
-            painter.fillRect(0, 0, size, size, Qt.gray)
+            painter.fillRect(0, 0, px, px, Qt.gray)
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, _avatar_mask(px))
         painter.end()
+        pm = QPixmap.fromImage(img)
+        pm.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pm)
         self.lbl_avatar.setPixmap(pm)
 
     def _update_sug_link_text(self):
@@ -178,18 +281,34 @@ class PersonDetailView(QWidget):
 
     def set_title(self, new_title: str) -> None:
         self.person_title = new_title or "Sin nombre"
-        self.lbl_title.setText(self.person_title)
+        if self._built:
+            self.lbl_title.setText(self.person_title)
 
     def show_all(self):
+        self._ensure_built()
         self.stack.setCurrentWidget(self.page_all)
         self.btn_all.setEnabled(False)
         self.btn_sugs.setEnabled(True)
 
     def show_suggestions(self):
+        self._ensure_built()
         self.stack.setCurrentWidget(self.page_sugs)
         self.btn_all.setEnabled(True)
         self.btn_sugs.setEnabled(False)
 
+    def _cols_for(self, page: QWidget) -> int:
+        gap = 16 if page is self.page_sugs else 12
+        return max(1, self.width() // (TILE + gap))
+
+    def _on_page_changed(self, idx: int):
+        page = self.stack.widget(idx)
+        if page in self._built_cols:
+            return
+        if page is self.page_sugs:
+            self._load_suggestions(fetch=not self._sugs_fetched)
+        elif page is self.page_all:
+            self._load_all()
+
     def _rename(self):
         old = self.person_title or "Sin nombre"
         new, ok = QInputDialog.getText(
@@ -233,69 +352,165 @@ class PersonDetailView(QWidget):
                 self.person_id, limit=400, offset=0)
             thumbs = [r.get("face_thumb") for r in rows if r.get("face_thumb")]
 
+        cols = self._cols_for(self.page_all)
+        self._built_cols[self.page_all] = cols
+        self._has_all = bool(thumbs)
         if not thumbs:
-            ph = QLabel("No hay elementos confirmados aún.", self.page_all)
-            ph.setObjectName("SectionText")
-            self._grid_all.addWidget(ph, 0, 0)
+            self._grid_all.addWidget(
+                make_placeholder(self._all_host, "No hay elementos confirmados aún."), 0, 0)
             return
 
-        cols = max(1, self.width() // (TILE + 12))
-        size = 140
+        # Las miniaturas se decodifican en el pool; mientras, relleno compartido
+        loader = thumb_loader()
         for i, tp in enumerate(thumbs):
-            lab = QLabel()
-            lab.setFixedSize(size, size)
+            lab = QLabel(self._all_host)
+            lab.setFixedSize(FACE_TILE, FACE_TILE)
             lab.setAlignment(Qt.AlignCenter)
-            pm = QPixmap(tp)
-            if pm.isNull():
-                pm = QPixmap(size, size)
-                pm.fill(Qt.darkGray)
-            lab.setPixmap(
-                pm.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            lab.setStyleSheet(
-                "background: rgba(255,255,255,0.06); border-radius: 6px;")
+            lab.setObjectName("FaceTile")  # estilo en core/theme.py
+            pm = loader.request(tp, FACE_TILE, lab,
+                                partial(self._set_face_pixmap, lab), crop=False)
+            self._set_face_pixmap(lab, pm)
             r, c = divmod(i, cols)
             self._grid_all.addWidget(lab, r, c)
-
-    def _load_suggestions(self):
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self._sugs = []
-
+        self._settle_layout(self._all_host)
+
+    @staticmethod
+    def _set_face_pixmap(lab: QLabel, pm: Optional[QPixmap]):
+        # ya viene escalada a FACE_TILE (cabe dentro, sin recorte)
+        lab.setPixmap(pm if pm is not None and not pm.isNull()
+                      else _empty_face(FACE_TILE))
+
+    def _settle_layout(self, host: QWidget):
+        # Resuelve estilo y geometría al construir (aunque la página esté
+        # oculta): el cambio de página queda en mostrar/ocultar.
+        host.ensurePolished()
+        host.layout().activate()
+
+    def _fetch_suggestions(self):
+        self._sugs = {}
+        self._sugs_fetched = True
         if self.store and self.person_id is not None:
             rows = self.store.list_person_suggestions(
                 self.person_id, limit=400, offset=0)
-            self._sugs = [
-                {"id": str(r["face_id"]), "thumb": r["thumb"]} for r in rows]
-
-        cols = max(1, self.width() // (TILE + 16))
-        for i, sug in enumerate(self._sugs):
-            tile = SuggestionTile(sug_id=str(
-                sug["id"]), thumb_path=sug.get("thumb"))
-            tile.acceptClicked.connect(self._on_accept)
-            tile.rejectClicked.connect(self._on_reject)
-            tile.discardClicked.connect(self._on_discard)
-            tile.coverClicked.connect(self._on_set_cover)
-            r, c = divmod(i, cols)
-            self.grid.addWidget(tile, r, c)
+            self._sugs = {
+                str(r["face_id"]): {"id": str(r["face_id"]), "thumb": r["thumb"]}
+                for r in rows}
+
+    def _ensure_sugs_page(self):
+        if self.grid is not None:
+            return
+        ls = QVBoxLayout(self.page_sugs)
+        ls.setContentsMargins(0, 0, 0, 0)
+        ls.setSpacing(0)
+        self.scroll = QScrollArea(self.page_sugs)
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setFrameShape(QFrame.NoFrame)
+        self.grid_host = QWidget(self.scroll)
+        self.grid = QGridLayout(self.grid_host)
+        self.grid.setContentsMargins(0, 0, 0, 0)
+        self.grid.setHorizontalSpacing(12)
+        self.grid.setVerticalSpacing(12)
+        self.scroll.setWidget(self.grid_host)
+        ls.addWidget(self.scroll, 1)
+
+    def _load_suggestions(self, fetch: bool = True):
+        self._ensure_sugs_page()
+        # Las tarjetas cuya sugerencia sigue vigente se reutilizan (misma
+        # imagen, mismas conexiones); solo se crean/destruyen las del delta.
+        while self.grid.count():
+            self.grid.takeAt(0)
+        spare = self._sug_tiles
+        self._sug_tiles = {}
+        if fetch:
+            self._fetch_suggestions()
+
+        cols = self._cols_for(self.page_sugs)
+        self._built_cols[self.page_sugs] = cols
+        # Un solo repintado/relayout para todo el lote: las tarjetas nacen
+        # ya con su padre (sin reparent) y la grilla se pinta al final.
+        self.grid_host.setUpdatesEnabled(False)
+        try:
+            for i, sug in enumerate(self._sugs.values()):
+                tile = spare.pop(sug["id"], None)
+                if tile is None or tile.thumb_path != sug.get("thumb"):
+                    if tile is not None:
+                        tile.deleteLater()
+                    tile = SuggestionTile(
+                        sug_id=sug["id"], thumb_path=sug.get("thumb"),
+                        parent=self.grid_host)
+                    tile.tileAction.connect(self._on_sug_action)
+                r, c = divmod(i, cols)
+                self.grid.addWidget(tile, r, c)
+                self._sug_tiles[sug["id"]] = tile
+            for tile in spare.values():
+                tile.deleteLater()
+        finally:
+            self.grid_host.setUpdatesEnabled(True)
+        self._settle_layout(self.grid_host)
 
         self._update_sug_link_text()
 
+    def _reflow_suggestions(self, start: int = 0):
+        """
+        Recoloca las tarjetas existentes sin recrearlas ni redecodificar.
+        Solo se mueven las que están desde `start`; las anteriores no cambian.
+        """
+        tiles = list(self._sug_tiles.values())[start:]
+        for tile in tiles:
+            self.grid.removeWidget(tile)
+        cols = self._cols_for(self.page_sugs)
+        for i, tile in enumerate(tiles, start):
+            r, c = divmod(i, cols)
+            self.grid.addWidget(tile, r, c)
+
     def _rebuild_visible(self):
-        if self.stack.currentWidget() is self.page_sugs:
-            self._load_suggestions()
-        else:
-            self._load_all()
+        if not self._built:
+            return
+        current = self.stack.currentWidget()
+        for page in (self.page_all, self.page_sugs):
+            built = self._built_cols.get(page)
+            if built is None or built == self._cols_for(page):
+                continue
+            if page is self.page_sugs:
+                # visible u oculta: se recolocan las tarjetas ya creadas y
+                # la página queda asentada para el próximo cambio
+                self._reflow_suggestions()
+                self._built_cols[page] = self._cols_for(page)
+                self._settle_layout(self.grid_host)
+            elif page is current:
+                self._load_all()
+            else:
+                # "Todos" oculta se reconstruye al volver a mostrarse
+                del self._built_cols[page]
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
         self._resize_timer.start()
 
     def _remove_sug_by_id(self, sug_id: str):
-        self._sugs = [s for s in self._sugs if str(s.get("id")) != str(sug_id)]
-        self._load_suggestions()
+        self._remove_sugs_by_ids([sug_id])
+
+    def _remove_sugs_by_ids(self, sug_ids: Iterable[str]):
+        """Quita varias sugerencias con un solo reflow y un solo aviso de conteo."""
+        keys = {str(k) for k in sug_ids}
+        first: Optional[int] = None
+        for i, key in enumerate(list(self._sug_tiles)):
+            if key in keys:
+                tile = self._sug_tiles.pop(key)
+                self.grid.removeWidget(tile)
+                tile.deleteLater()
+                if first is None:
+                    first = i
+        for key in keys:
+            self._sugs.pop(key, None)
+        if first is not None:
+            self._reflow_suggestions(first)
+        self._update_sug_link_text()
+
+    def _on_sug_action(self, action: str, sug_id: str):
+        slot = self._SUG_DISPATCH.get(action)
+        if slot:
+            getattr(self, slot)(sug_id)
 
     def _on_accept(self, sug_id: str):
         if self.store and self.person_id is not None:
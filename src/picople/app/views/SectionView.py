@@ -5,6 +5,19 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QSizePolicy
 from PySide6.QtCore import Qt
 
 
+def make_placeholder(parent: Optional[QWidget], text: str) -> QLabel:
+    """
+    Texto de estado vacío con el estilo de sección ("SectionText").
+    Sin word-wrap y de tamaño fijo: los saltos van explícitos con "\n" y el
+    texto no se re-parte en cada resize.
+    """
+    lbl = QLabel(text, parent)
+    lbl.setObjectName("SectionText")
+    lbl.ensurePolished()  # la fuente del QSS entra en el sizeHint
+    lbl.setFixedSize(lbl.sizeHint())
+    return lbl
+
+
 class SectionView(QWidget):
     """
     Base de secciones con:
@@ -30,13 +43,13 @@ class SectionView(QWidget):
         self.title_lbl.setObjectName("SectionTitle")
         self.title_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
-        self.sub_lbl = QLabel(subtitle or "")
-        self.sub_lbl.setWordWrap(True)
-        self.sub_lbl.setObjectName("SectionText")
-
         header_lay.addWidget(self.title_lbl)
+
+        # El subtítulo solo existe si hay texto; set_header lo crea si hace falta
+        self._header_lay = header_lay
+        self.sub_lbl: Optional[QLabel] = None
         if subtitle:
-            header_lay.addWidget(self.sub_lbl)
+            self._set_sub_text(subtitle)
 
         # Separador fino
         self._separator = QFrame()
@@ -44,6 +57,12 @@ class SectionView(QWidget):
         self._separator.setObjectName("SectionSeparator")
         self._separator.setFixedHeight(1)
 
+        # Header y separador no cambian al desplazar/redimensionar el cuerpo:
+        # Qt solo pinta lo que aparece nuevo. El separador es opaco (fondo QSS).
+        self._header_widget.setAttribute(Qt.WA_StaticContents, True)
+        self._separator.setAttribute(Qt.WA_StaticContents, True)
+        self._separator.setAttribute(Qt.WA_OpaquePaintEvent, True)
+
         root.addWidget(self._header_widget)
         root.addWidget(self._separator)
 
@@ -67,10 +86,27 @@ class SectionView(QWidget):
     def set_header(self, *, title: Optional[str] = None, subtitle: Optional[str] = None, show_subtitle: Optional[bool] = None):
         if title is not None:
             self.title_lbl.setText(title)
+        # sin etiqueta previa, solo se crea si habrá algo que mostrar
+        if self.sub_lbl is None and not (subtitle or show_subtitle):
+            return
+        lbl = self._ensure_sub_lbl()
         if subtitle is not None:
-            self.sub_lbl.setText(subtitle or "")
+            self._set_sub_text(subtitle or "")
         if show_subtitle is not None:
-            self.sub_lbl.setVisible(bool(show_subtitle))
+            lbl.setVisible(bool(show_subtitle))
+
+    def _ensure_sub_lbl(self) -> QLabel:
+        if self.sub_lbl is None:
+            self.sub_lbl = QLabel(self._header_widget)
+            self.sub_lbl.setObjectName("SectionText")
+            self._header_lay.addWidget(self.sub_lbl)
+        return self.sub_lbl
+
+    def _set_sub_text(self, text: str) -> None:
+        lbl = self._ensure_sub_lbl()
+        # con saltos explícitos no hace falta partir líneas en cada resize
+        lbl.setWordWrap("\n" not in text)
+        lbl.setText(text)
 
     def set_header_visible(self, visible: bool):
         self._header_widget.setVisible(visible)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal, QSettings
+from PySide6.QtCore import Qt, Signal, QSettings, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QSpinBox, QCheckBox,
     QComboBox, QToolButton, QMessageBox
@@ -12,6 +12,22 @@ from picople.app.controllers import SystemProbe, ProbeResult
 from .SectionView import SectionView
 
 
+class _ProbeSignals(QObject):
+    finished = Signal(object)  # ProbeResult
+
+
+class _ProbeWorker(QRunnable):
+    """Sondea el hardware en el pool; el resultado vuelve por señal al hilo GUI."""
+
+    def __init__(self, refresh: bool):
+        super().__init__()
+        self.refresh = refresh
+        self.signals = _ProbeSignals()
+
+    def run(self):
+        self.signals.finished.emit(SystemProbe.cached(refresh=self.refresh))
+
+
 class SettingsView(SectionView):
     """
     Preferencias: indexación, colección, IA; lectura de hardware y sugerencias.
@@ -23,13 +39,23 @@ class SettingsView(SectionView):
         self.settings = settings
         lay = self.content_layout
 
+        # sync() diferido: varios "Guardar" seguidos = un solo flush a disco/registro
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(250)
+        self._sync_timer.timeout.connect(self.settings.sync)
+
+        # Una sola pasada por QSettings para los valores que muestra la vista
+        cur = {k: self.settings.value(k) for k in self.settings.allKeys()
+               if k.startswith(("indexer/", "collection/", "ai/"))}
+
         # ---- Hardware (lectura) ----
         self.lbl_hw = QLabel("Hardware: (sin leer)")
         self.lbl_hw.setObjectName("SectionText")
         self.btn_probe = QToolButton()
         self.btn_probe.setObjectName("ToolbarBtn")
         self.btn_probe.setText("Detectar hardware")
-        self.btn_probe.clicked.connect(self._on_probe)
+        self.btn_probe.clicked.connect(self._on_redetect)
 
         row_hw = QHBoxLayout()
         row_hw.setSpacing(8)
@@ -43,9 +69,9 @@ class SettingsView(SectionView):
         self.sp_idx_thumb.setRange(128, 768)
         self.sp_idx_thumb.setSingleStep(32)
         self.sp_idx_thumb.setValue(
-            int(self.settings.value("indexer/thumb_size", 320)))
+            int(cur.get("indexer/thumb_size", 320)))
         self.cb_video_thumbs = QCheckBox("Miniaturas de video (ffmpeg)")
-        self.cb_video_thumbs.setChecked(str(self.settings.value(
+        self.cb_video_thumbs.setChecked(str(cur.get(
             "indexer/video_thumbs", "1")) in ("1", "true", "True"))
 
         row_idx.addWidget(QLabel("Miniatura indexación (px):"))
@@ -61,12 +87,12 @@ class SettingsView(SectionView):
         self.sp_tile.setRange(128, 256)
         self.sp_tile.setSingleStep(8)
         self.sp_tile.setValue(
-            int(self.settings.value("collection/tile_size", 160)))
+            int(cur.get("collection/tile_size", 160)))
         self.sp_batch = QSpinBox()
         self.sp_batch.setRange(50, 500)
         self.sp_batch.setSingleStep(50)
         self.sp_batch.setValue(
-            int(self.settings.value("collection/batch", 200)))
+            int(cur.get("collection/batch", 200)))
 
         row_coll.addWidget(QLabel("Tamaño miniatura colección (px):"))
         row_coll.addWidget(self.sp_tile)
@@ -81,7 +107,7 @@ class SettingsView(SectionView):
         self.cmb_provider = QComboBox()
         self.cmb_provider.addItems(["Auto", "CPU", "DML", "CUDA"])
         self.cmb_provider.setCurrentText(
-            str(self.settings.value("ai/provider", "Auto")))
+            str(cur.get("ai/provider", "Auto")))
         row_ai.addWidget(QLabel("Proveedor de inferencia (ONNX):"))
         row_ai.addWidget(self.cmb_provider)
         row_ai.addStretch(1)
@@ -117,12 +143,28 @@ class SettingsView(SectionView):
         lay.addSpacing(8)
         lay.addLayout(row_btns)
 
-        # Leer hardware al entrar (opcional)
+        # Leer hardware al entrar (opcional); en segundo plano
+        self._probe_worker: Optional[_ProbeWorker] = None
+        self._suggest_pending = False
         self._on_probe()
 
     # ---------- Slots ----------
-    def _on_probe(self):
-        pr: ProbeResult = SystemProbe.read()
+    def _on_redetect(self):
+        self._on_probe(refresh=True)
+
+    def _on_probe(self, refresh: bool = False):
+        if self._probe_worker is not None:
+            return  # ya hay una sonda en curso
+        self.btn_probe.setEnabled(False)
+        self.lbl_hw.setText("Hardware: detectando…")
+        worker = _ProbeWorker(refresh)
+        worker.signals.finished.connect(self._apply_probe)
+        self._probe_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_probe(self, pr: ProbeResult):
+        self._probe_worker = None
+        self.btn_probe.setEnabled(True)
         providers = ", ".join(
             pr.onnx_providers) if pr.onnx_providers else "N/D"
         gpu_name = pr.nvidia_name or (
@@ -135,10 +177,16 @@ class SettingsView(SectionView):
         )
         self.lbl_hw.setText(txt)
         self._last_suggested = pr.suggested
+        if self._suggest_pending:
+            self._suggest_pending = False
+            self._on_suggest()
 
     def _on_suggest(self):
         if not hasattr(self, "_last_suggested"):
+            # se aplica al llegar el resultado de la sonda
+            self._suggest_pending = True
             self._on_probe()
+            return
         sug = getattr(self, "_last_suggested", {})
         if not sug:
             QMessageBox.information(
@@ -173,7 +221,7 @@ class SettingsView(SectionView):
         cfg = self._collect_settings()
         for k, v in cfg.items():
             self.settings.setValue(k, v)
-        self.settings.sync()
+        self._sync_timer.start()
         self.settingsApplied.emit(cfg)
         QMessageBox.information(self, "Preferencias",
                                 "Preferencias guardadas.")
@@ -2,26 +2,42 @@
 from __future__ import annotations
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap, QPainter
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QToolButton
 
+from picople.infrastructure.thumb_cache import thumb_loader
+
 
 TILE = 160
 TILE_MARGIN = 8
 TILE_BTN_H = 28
 
+_FALLBACK_PIXMAP: Optional[QPixmap] = None
+
+
+def _fallback_pixmap() -> QPixmap:
+    """Placeholder compartido (se dibuja una sola vez; requiere QApplication)."""
+    global _FALLBACK_PIXMAP
+    if _FALLBACK_PIXMAP is None:
+        pm = QPixmap(TILE, TILE)
+        pm.fill(Qt.gray)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setPen(Qt.NoPen)
+        p.setBrush(Qt.lightGray)
+        p.drawEllipse(pm.rect().adjusted(24, 24, -24, -24))
+        p.end()
+        _FALLBACK_PIXMAP = pm
+    return _FALLBACK_PIXMAP
+
 
 class SuggestionTile(QWidget):
     """
     Tarjeta de sugerencia con: imagen, ✔, ✖, ⭐ y 🗑 (falso positivo).
-    Señales: acceptClicked(id), rejectClicked(id), coverClicked(id), discardClicked(id)
+    Señal única: tileAction(acción, id) con acción en "accept" | "reject" | "cover" | "discard".
     """
-    from PySide6.QtCore import Signal
-    acceptClicked = Signal(str)
-    rejectClicked = Signal(str)
-    coverClicked = Signal(str)
-    discardClicked = Signal(str)
+    tileAction = Signal(str, str)
 
     def __init__(self, sug_id: str, thumb_path: Optional[str] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -48,21 +64,18 @@ class SuggestionTile(QWidget):
         self.btn_ok = QToolButton(self)
         self.btn_ok.setObjectName("ToolbarBtn")
         self.btn_ok.setText("✔")
-        self.btn_ok.clicked.connect(
-            lambda: self.acceptClicked.emit(self.sug_id))
+        self.btn_ok.clicked.connect(self._emit_accept)
 
         self.btn_no = QToolButton(self)
         self.btn_no.setObjectName("ToolbarBtn")
         self.btn_no.setText("✖")
-        self.btn_no.clicked.connect(
-            lambda: self.rejectClicked.emit(self.sug_id))
+        self.btn_no.clicked.connect(self._emit_reject)
 
         self.btn_star = QToolButton(self)
         self.btn_star.setObjectName("ToolbarBtn")
         self.btn_star.setText("⭐")
         self.btn_star.setToolTip("Usar como portada")
-        self.btn_star.clicked.connect(
-            lambda: self.coverClicked.emit(self.sug_id))
+        self.btn_star.clicked.connect(self._emit_cover)
 
         bar.addWidget(self.btn_ok)
         bar.addWidget(self.btn_no)
@@ -74,27 +87,38 @@ class SuggestionTile(QWidget):
         self.btn_trash.setText("🗑")
         self.btn_trash.setFixedSize(28, 28)
         self.btn_trash.setToolTip("Descartar (falso positivo)")
-        self.btn_trash.clicked.connect(
-            lambda: self.discardClicked.emit(self.sug_id))
+        self.btn_trash.clicked.connect(self._emit_discard)
         self.btn_trash.raise_()
 
         root.addWidget(self.lbl_img)
         root.addLayout(bar)
 
+    # slots ligados (sin closures por botón)
+    def _emit_accept(self):
+        self.tileAction.emit("accept", self.sug_id)
+
+    def _emit_reject(self):
+        self.tileAction.emit("reject", self.sug_id)
+
+    def _emit_cover(self):
+        self.tileAction.emit("cover", self.sug_id)
+
+    def _emit_discard(self):
+        self.tileAction.emit("discard", self.sug_id)
+
     def _load_thumb(self):
-        if self.thumb_path:
-            pm = QPixmap(self.thumb_path)
-        else:
-            pm = QPixmap(TILE, TILE)
-            pm.fill(Qt.gray)
-            p = QPainter(pm)
-            p.setRenderHint(QPainter.Antialiasing, True)
-            p.setPen(Qt.NoPen)
-            p.setBrush(Qt.lightGray)
-            r = pm.rect().adjusted(24, 24, -24, -24)
-            p.drawEllipse(r)
-            p.end()
-        if not pm.isNull():
+        # placeholder compartido mientras el pool decodifica
+        self.lbl_img.setPixmap(_fallback_pixmap())
+        if not self.thumb_path:
+            return
+        pm = thumb_loader().request(self.thumb_path, TILE, self, self._set_thumb)
+        if pm is not None:
+            self._set_thumb(pm)
+
+    def _set_thumb(self, pm: QPixmap):
+        if pm.isNull():
+            return
+        if min(pm.width(), pm.height()) != TILE:
             pm = pm.scaled(
                 TILE, TILE, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
         self.lbl_img.setPixmap(pm)
@@ -1,100 +1,188 @@
 # src/picople/app/views/ThumbDelegate.py
 from __future__ import annotations
-from PySide6.QtCore import Qt, QRect, QSize, QPoint
-from PySide6.QtGui import QPainter, QIcon, QPixmap, QColor, QPainterPath
-from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QWidget, QStyle
+from typing import Dict, Tuple
+
+from PySide6.QtCore import Qt, QRectF, QSize
+from PySide6.QtGui import QPainter, QPixmap, QPixmapCache, QColor, QPainterPath
+from PySide6.QtWidgets import (
+    QApplication, QStyledItemDelegate, QStyleOptionViewItem, QWidget, QStyle)
 
 # Importa roles desde el model (fuente única)
-from picople.app.controllers.MediaListModel import ROLE_KIND, ROLE_FAVORITE
+from picople.app.controllers.MediaListModel import ROLE_FLAGS, FLAG_FAVORITE, FLAG_VIDEO
+
+# ---- Recursos estáticos de overlays (se construyen una vez) ----
+# centros de los badges: a (R + 6) px de la esquina
+R_PLAY = 14
+R_HEART = 10
+
+_PLAY_BG = QColor(0, 0, 0, 160)
+_PLAY_FG = QColor(255, 255, 255)
+_HEART_BG = QColor(0, 0, 0, 140)
+_HEART_FG = QColor(255, 80, 100)
+
+
+def _play_path() -> QPainterPath:
+    # relativo al centro del badge; se dibuja con painter.translate(cx, cy)
+    tri = QPainterPath()
+    tri.moveTo(-4, -6)
+    tri.lineTo(-4, 6)
+    tri.lineTo(6, 0)
+    tri.closeSubpath()
+    return tri
+
+
+def _heart_path() -> QPainterPath:
+    heart = QPainterPath()
+    heart.moveTo(0, 3)
+    heart.cubicTo(10, -6, 6, -14, 0, -6)
+    heart.cubicTo(-6, -14, -10, -6, 0, 3)
+    return heart
+
+
+_PLAY_PATH = _play_path()
+_HEART_PATH = _heart_path()
+
+BADGE = 28  # lado de los overlays pre-renderizados (radio 14)
+# desplazamiento de la esquina del badge respecto al borde del icono
+_PLAY_OFF = R_PLAY + 6 + BADGE // 2
+_HEART_OFF = R_HEART + 6 + BADGE // 2
+_BADGES: Dict[Tuple[str, float], QPixmap] = {}
+
+
+def _badge(name: str, dpr: float) -> QPixmap:
+    """Círculo + símbolo rasterizados una vez por dpr; paint() solo hace blit."""
+    key = (name, dpr)
+    pm = _BADGES.get(key)
+    if pm is None:
+        bg, fg, path = ((_PLAY_BG, _PLAY_FG, _PLAY_PATH) if name == "play"
+                        else (_HEART_BG, _HEART_FG, _HEART_PATH))
+        side = int(round(BADGE * dpr))
+        pm = QPixmap(side, side)
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setPen(Qt.NoPen)
+        p.setBrush(bg)
+        p.drawEllipse(QRectF(0, 0, BADGE, BADGE))
+        p.translate(BADGE / 2, BADGE / 2)
+        p.setBrush(fg)
+        p.drawPath(path)
+        p.end()
+        _BADGES[key] = pm
+    return pm
+
+
+# enums como int una sola vez: `flag & flag` pasa por enum.Flag en Python
+_SELECTED = QStyle.State_Selected.value
+
+
+def _scaled_cache_key(pm: QPixmap, tile: int) -> str:
+    # cacheKey cambia si cambia el pixmap fuente: invalida solo
+    return f"tdlg:{pm.cacheKey()}:{tile}"
 
 
 class ThumbDelegate(QStyledItemDelegate):
-    def __init__(self, tile: int = 160, text_lines: int = 0, parent: QWidget | None = None):
+    """
+    Miniatura centrada + overlays opcionales. Las banderas se fijan al construir
+    para que paint() no pague por lo que la vista no usa:
+      show_fav          corazón si ROLE_FLAGS tiene FLAG_FAVORITE
+      show_video_badge  botón ▶ si ROLE_FLAGS tiene FLAG_VIDEO
+    text_lines solo reserva alto en sizeHint; no se dibuja texto.
+    """
+
+    def __init__(self, tile: int = 160, text_lines: int = 0, parent: QWidget | None = None,
+                 *, show_fav: bool = False, show_video_badge: bool = False):
         super().__init__(parent)
         self.tile = int(tile)
         self.text_lines = max(0, int(text_lines))
+        self.show_fav = bool(show_fav)
+        self.show_video_badge = bool(show_video_badge)
         self.vpad = 8
         self.hpad = 10
         self.text_pad_top = 6
+        # sizeHint solo depende de (tile, alto de línea)
+        self._hint_key: Tuple[int, int] = (-1, -1)
+        self._hint = QSize()
+
+    def _scaled(self, pm: QPixmap, fast: bool = False) -> QPixmap:
+        tile = self.tile
+        w, h = pm.width(), pm.height()
+        # ya cabe con un lado igual al tile: escalar no cambiaría nada
+        if w <= tile and h <= tile and (w == tile or h == tile):
+            return pm
+        # QPixmapCache: presupuesto en bytes compartido con el resto de la app
+        key = _scaled_cache_key(pm, tile)
+        pm2 = QPixmapCache.find(key)
+        if pm2 is not None:
+            return pm2
+        if fast:
+            # durante el scroll: escalado rápido sin cachear; el repintado
+            # al detenerse genera (y guarda) la versión suave
+            return pm.scaled(tile, tile, Qt.KeepAspectRatio, Qt.FastTransformation)
+        pm2 = pm.scaled(tile, tile, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pm2)
+        return pm2
 
     def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
-        fm = option.fontMetrics
-        line_h = fm.height()
-        text_h = (line_h * self.text_lines) if self.text_lines > 0 else 0
-        pad_top = (self.text_pad_top if self.text_lines > 0 else 0)
-        h = self.vpad + self.tile + pad_top + text_h + self.vpad
-        w = self.hpad + self.tile + self.hpad
-        return QSize(w, h)
+        line_h = option.fontMetrics.height() if self.text_lines > 0 else 0
+        key = (self.tile, line_h)
+        if key != self._hint_key:
+            text_h = line_h * self.text_lines
+            pad_top = self.text_pad_top if self.text_lines > 0 else 0
+            h = self.vpad + self.tile + pad_top + text_h + self.vpad
+            w = self.hpad + self.tile + self.hpad
+            self._hint_key, self._hint = key, QSize(w, h)
+        return self._hint
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        # locales: paint es lo más caliente del scroll (LOAD_FAST vs LOAD_ATTR)
+        rect = option.rect
+        # celda fuera del área a repintar: nada que hacer (ni save/restore)
+        if painter.hasClipping() and not painter.clipBoundingRect().intersects(rect):
+            return
+        tile = self.tile
+        hpad = self.hpad
+        vpad = self.vpad
+        get = index.data
+
         painter.save()
 
-        # Selección
-        if option.state & QStyle.State_Selected:
-            painter.fillRect(option.rect, option.palette.highlight())
-
-        # Área interior
-        r = option.rect.adjusted(self.hpad, self.vpad, -self.hpad, -self.vpad)
-        icon_rect = QRect(r.left(), r.top(), r.width(), self.tile)
-        text_rect = QRect(
-            r.left(),
-            r.top() + self.tile + (self.text_pad_top if self.text_lines > 0 else 0),
-            r.width(),
-            r.height() - self.tile - (self.text_pad_top if self.text_lines > 0 else 0),
-        )
-
-        # Pixmap centrado
-        deco = index.data(Qt.DecorationRole)
-        pm: QPixmap | None = None
-        if isinstance(deco, QIcon):
-            pm = deco.pixmap(self.tile, self.tile)
-        elif isinstance(deco, QPixmap):
-            pm = deco
-        if pm and not pm.isNull():
-            pm2 = pm.scaled(self.tile, self.tile,
-                            Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            x = icon_rect.left() + (icon_rect.width() - pm2.width()) // 2
-            y = icon_rect.top() + (icon_rect.height() - pm2.height()) // 2
-            painter.drawPixmap(x, y, pm2)
-
-        # Overlays: tipo y favorito
-        kind = index.data(ROLE_KIND)
-        is_fav = bool(index.data(ROLE_FAVORITE) or False)
-
-        if kind == "video":
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            r_play = 14
-            cx = icon_rect.right() - r_play - 6
-            cy = icon_rect.bottom() - r_play - 6
-            painter.save()
-            painter.setBrush(QColor(0, 0, 0, 160))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPoint(cx, cy), r_play, r_play)
-            tri = QPainterPath()
-            tri.moveTo(cx - 4, cy - 6)
-            tri.lineTo(cx - 4, cy + 6)
-            tri.lineTo(cx + 6, cy)
-            tri.closeSubpath()
-            painter.setBrush(QColor(255, 255, 255))
-            painter.drawPath(tri)
-            painter.restore()
-
-        if is_fav:
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            r_heart = 10
-            cx = icon_rect.right() - r_heart - 6
-            cy = icon_rect.top() + r_heart + 6
-            painter.save()
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(0, 0, 0, 140))
-            painter.drawEllipse(QPoint(cx, cy), r_heart + 4, r_heart + 4)
-            painter.setBrush(QColor(255, 80, 100))
-            heart = QPainterPath()
-            heart.moveTo(cx, cy + 3)
-            heart.cubicTo(cx + 10, cy - 6, cx + 6, cy - 14, cx, cy - 6)
-            heart.cubicTo(cx - 6, cy - 14, cx - 10, cy - 6, cx, cy + 3)
-            painter.drawPath(heart)
-            painter.restore()
+        # Selección: la dibuja el estilo (respeta QListView::item:selected del tema)
+        if option.state.value & _SELECTED:
+            widget = option.widget
+            style = widget.style() if widget is not None else QApplication.style()
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+
+        # Área interior (aritmética entera, sin QRect intermedios)
+        left = rect.x() + hpad
+        top = rect.y() + vpad
+        width = rect.width() - 2 * hpad
+        right = left + width - 1
+
+        # sin área de miniatura no hay pixmap ni overlays que consultar
+        if tile > 0 and width > 0:
+            # Pixmap centrado
+            pm: QPixmap | None = get(Qt.DecorationRole)
+            if pm is not None and not pm.isNull():
+                w = option.widget
+                pm2 = self._scaled(pm, fast=bool(w is not None and w.property("scrolling")))
+                painter.drawPixmap(left + (width - pm2.width()) // 2,
+                                   top + (tile - pm2.height()) // 2, pm2)
+
+            # Overlays: tipo y favorito (solo los habilitados)
+            # una sola consulta al model para ambos overlays
+            flags = (get(ROLE_FLAGS) or 0) if (self.show_video_badge or self.show_fav) else 0
+            video = self.show_video_badge and flags & FLAG_VIDEO
+            fav = self.show_fav and flags & FLAG_FAVORITE
+            if video or fav:
+                dpr = painter.device().devicePixelRatioF()
+                if video:
+                    painter.drawPixmap(right - _PLAY_OFF, top + tile - 1 - _PLAY_OFF,
+                                       _badge("play", dpr))
+                if fav:
+                    painter.drawPixmap(right - _HEART_OFF, top + R_HEART + 6 - BADGE // 2,
+                                       _badge("heart", dpr))
 
         # (Sin texto: text_lines=0)
         painter.restore()
@@ -1,14 +1,19 @@
 from __future__ import annotations
-from PySide6.QtCore import QUrl, Qt, Signal
+from PySide6.QtCore import QUrl, Signal, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from picople.core.log import log
 
+# estados resueltos una vez (evita la búsqueda del enum en cada señal)
+_READY_STATUSES = (QMediaPlayer.LoadedMedia, QMediaPlayer.BufferedMedia)
+_PLAYING = QMediaPlayer.PlayingState
+
 
 class VideoView(QWidget):
-    positionChanged = Signal(int)     # ms
-    durationChanged = Signal(int)     # ms
+    # qint64 como QMediaPlayer: permite reenviar señal→señal sin pasar por Python
+    positionChanged = Signal("qint64")     # ms
+    durationChanged = Signal("qint64")     # ms
     mutedChanged = Signal(bool)
     volumeChanged = Signal(int)     # 0..100
     playingChanged = Signal(bool)    # True si en reproducción
@@ -28,22 +33,54 @@ class VideoView(QWidget):
         self.player.setVideoOutput(self.video_widget)
         self.player.setAudioOutput(self.audio)
 
+        # Segundo player oculto: precarga el siguiente video mientras se ve
+        # el actual; al navegar se intercambian en vez de re-crear el pipeline
+        self._next_audio = QAudioOutput(self)
+        self._next_player = QMediaPlayer(self)
+        self._next_player.setAudioOutput(self._next_audio)
+        self._preload_url = QUrl()
+        self._preload_timer = QTimer(self)
+        self._preload_timer.setSingleShot(True)
+        self._preload_timer.setInterval(300)
+        self._preload_timer.timeout.connect(self._do_preload)
+
         self._ready = False
         self._pending_play = False
 
-        # Conexiones
-        self.player.mediaStatusChanged.connect(self._on_status)
-        self.player.playbackStateChanged.connect(self._on_state)
-        self.player.errorOccurred.connect(self._on_error)
-        self.player.positionChanged.connect(
-            lambda p: (self.positionChanged.emit(p), None))
-        self.player.durationChanged.connect(
-            lambda d: (self.durationChanged.emit(d), None))
+        # Conexiones (solo el player activo)
+        self._wire(self.player)
+
+    def _wire(self, player: QMediaPlayer) -> None:
+        player.mediaStatusChanged.connect(self._on_status)
+        player.playbackStateChanged.connect(self._on_state)
+        player.errorOccurred.connect(self._on_error)
+        player.positionChanged.connect(self.positionChanged)
+        player.durationChanged.connect(self.durationChanged)
+
+    def _unwire(self, player: QMediaPlayer) -> None:
+        player.mediaStatusChanged.disconnect(self._on_status)
+        player.playbackStateChanged.disconnect(self._on_state)
+        player.errorOccurred.disconnect(self._on_error)
+        player.positionChanged.disconnect(self.positionChanged)
+        player.durationChanged.disconnect(self.durationChanged)
+
+    def _swap_players(self) -> None:
+        old, new = self.player, self._next_player
+        old.stop()
+        self._unwire(old)
+        old.setVideoOutput(None)
+        old.setSource(QUrl())
+        # el audio nuevo hereda volumen/mute del actual
+        self._next_audio.setVolume(self.audio.volume())
+        self._next_audio.setMuted(self.audio.isMuted())
+        new.setVideoOutput(self.video_widget)
+        self.player, self._next_player = new, old
+        self.audio, self._next_audio = self._next_audio, self.audio
+        self._wire(new)
 
     # -------- Internos / logs --------
     def _on_status(self, st):
-        self._ready = st in (QMediaPlayer.LoadedMedia,
-                             QMediaPlayer.BufferedMedia)
+        self._ready = st in _READY_STATUSES
         if self._ready and self._pending_play:
             self._pending_play = False
             try:
@@ -52,7 +89,7 @@ class VideoView(QWidget):
                 log("VideoView.autoplay EXC:", e)
 
     def _on_state(self, st):
-        is_playing = (st == QMediaPlayer.PlayingState)
+        is_playing = (st == _PLAYING)
         self.playingChanged.emit(is_playing)
 
     def _on_error(self, err, msg):
@@ -66,14 +103,33 @@ class VideoView(QWidget):
         self.playingChanged.emit(False)
 
     # -------- API pública --------
+    def preload_path(self, path: str) -> None:
+        """Precarga `path` en el player oculto cuando la UI quede ociosa."""
+        self._preload_url = QUrl.fromLocalFile(path)
+        self._preload_timer.start()
+
+    def _do_preload(self):
+        if self._next_player.source() != self._preload_url:
+            self._next_player.setSource(self._preload_url)
+
     def load_path(self, path: str) -> bool:
+        url = QUrl.fromLocalFile(path)
+        if (self._next_player.source() == url
+                and self._next_player.mediaStatus() in _READY_STATUSES):
+            # ya precargado: intercambio sin desmontar el pipeline
+            self._pending_play = False
+            self._swap_players()
+            self._ready = True
+            # durationChanged se emitió mientras estaba desconectado
+            self.durationChanged.emit(self.player.duration())
+            self.positionChanged.emit(0)
+            return True
         try:
             self._pending_play = False
             self.player.stop()
             self.player.setSource(QUrl())
             self._ready = False
 
-            url = QUrl.fromLocalFile(path)
             self.player.setSource(url)
             return True
         except Exception as e:
@@ -86,7 +142,7 @@ class VideoView(QWidget):
         return self._ready
 
     def play_pause(self):
-        if self.player.playbackState() == QMediaPlayer.PlayingState:
+        if self.player.playbackState() == _PLAYING:
             self.player.pause()
         else:
             if not self._ready:
@@ -96,26 +152,19 @@ class VideoView(QWidget):
             except Exception as e:
                 log("VideoView.play EXC:", e)
 
+    # setters triviales: sin try/except (se llaman con autorepetición de teclas)
     def set_position(self, ms: int):
-        try:
-            self.player.setPosition(max(0, ms))
-        except Exception as e:
-            log("VideoView.set_position EXC:", e)
+        self.player.setPosition(max(0, ms))
 
     def set_volume(self, vol: int):
         vol = max(0, min(100, vol))
-        try:
-            self.audio.setVolume(vol/100.0)
-            self.volumeChanged.emit(vol)
-        except Exception as e:
-            log("VideoView.set_volume EXC:", e)
+        self.audio.setVolume(vol/100.0)
+        self.volumeChanged.emit(vol)
 
     def toggle_mute(self):
-        try:
-            self.audio.setMuted(not self.audio.isMuted())
-            self.mutedChanged.emit(self.audio.isMuted())
-        except Exception as e:
-            log("VideoView.toggle_mute EXC:", e)
+        muted = not self.audio.isMuted()
+        self.audio.setMuted(muted)
+        self.mutedChanged.emit(muted)
 
     def stop(self):
         try:
@@ -129,4 +178,6 @@ class VideoView(QWidget):
 
     def closeEvent(self, e):
         self.stop()
+        self._preload_timer.stop()
+        self._next_player.setSource(QUrl())
         super().closeEvent(e)
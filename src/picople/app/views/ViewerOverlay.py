@@ -2,7 +2,6 @@ from __future__ import annotations
 from typing import List
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtGui import QPainter, QColor
 from picople.app.controllers import MediaItem
 from .MediaViewerPanel import MediaViewerPanel
 
@@ -10,6 +9,7 @@ from .MediaViewerPanel import MediaViewerPanel
 class ViewerOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # fondo semitransparente vía QSS (#ViewerOverlay en core/theme.py)
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
         self.setObjectName("ViewerOverlay")
@@ -34,12 +34,6 @@ class ViewerOverlay(QWidget):
         self.show()
         self.raise_()
 
-    def paintEvent(self, e):
-        # fondo semitransparente
-        p = QPainter(self)
-        p.fillRect(self.rect(), QColor(0, 0, 0, 180))
-        super().paintEvent(e)
-
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Escape:
             self.hide()
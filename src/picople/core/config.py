@@ -1,34 +1,91 @@
 # src/picople/core/config.py
 from __future__ import annotations
-from typing import List
-from PySide6.QtCore import QSettings
+from typing import TYPE_CHECKING, List, Optional
+
+# Qt se importa al primer uso: entradas headless no cargan QtCore por importar esto
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSettings, QTimer
 
 KEY_ROOT_DIRS = "paths/roots"
 
+# QSettings y la lista decodificada se leen una sola vez; las escrituras
+# actualizan la caché (evita releer registro/INI en cada llamada)
+_settings: Optional[QSettings] = None
+_roots: Optional[List[str]] = None
+
+# escrituras diferidas: varias altas/bajas seguidas → un solo setValue+sync
+_dirty = False
+_flush_timer: Optional[QTimer] = None
+
+
+def _get_settings() -> QSettings:
+    global _settings
+    if _settings is None:
+        from PySide6.QtCore import QSettings
+        _settings = QSettings()
+    return _settings
+
+
+def flush() -> None:
+    """Persiste los cambios pendientes (lo llama el timer o al salir)."""
+    global _dirty
+    if not _dirty:
+        return
+    _dirty = False
+    s = _get_settings()
+    # QSettings almacena listas de cadenas sin problema
+    s.setValue(KEY_ROOT_DIRS, _roots)
+    s.sync()
+
+
+def _arm_flush() -> None:
+    global _flush_timer
+    if _flush_timer is None:
+        from PySide6.QtCore import QCoreApplication, QTimer
+        _flush_timer = QTimer()
+        _flush_timer.setSingleShot(True)
+        _flush_timer.setInterval(50)
+        _flush_timer.timeout.connect(flush)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(flush)
+    _flush_timer.start()
+
 
 def get_root_dirs() -> List[str]:
-    s = QSettings()
-    val = s.value(KEY_ROOT_DIRS, [])
-    if isinstance(val, (list, tuple)):
-        return [str(x) for x in val]
-    if isinstance(val, str):
-        return [val] if val else []
-    return []
+    global _roots
+    if _roots is None:
+        val = _get_settings().value(KEY_ROOT_DIRS, [])
+        if isinstance(val, (list, tuple)):
+            _roots = [str(x) for x in val]
+        elif isinstance(val, str):
+            _roots = [val] if val else []
+        else:
+            _roots = []
+    return list(_roots)  # copia: el llamador puede mutarla
+
+
+def _write_roots(dirs: List[str]) -> None:
+    global _roots, _dirty
+    _roots = dirs
+    _dirty = True
+    _arm_flush()
 
 
 def set_root_dirs(dirs: List[str]) -> None:
-    s = QSettings()
-    # QSettings almacena listas de cadenas sin problema
-    s.setValue(KEY_ROOT_DIRS, list(dict.fromkeys(dirs)))  # sin duplicados
+    dirs = list(dirs)
+    if len(set(dirs)) != len(dirs):
+        dirs = list(dict.fromkeys(dirs))  # sin duplicados, conserva orden
+    _write_roots(dirs)
 
 
 def add_root_dir(path: str) -> None:
-    dirs = get_root_dirs()
-    if path and path not in dirs:
-        dirs.append(path)
-        set_root_dirs(dirs)
+    get_root_dirs()
+    if path and path not in _roots:
+        _write_roots(_roots + [path])
 
 
 def remove_root_dir(path: str) -> None:
-    dirs = [d for d in get_root_dirs() if d != path]
-    set_root_dirs(dirs)
+    get_root_dirs()
+    if path in _roots:
+        _write_roots([d for d in _roots if d != path])
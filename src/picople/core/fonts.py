@@ -22,17 +22,23 @@ def load_orgon_and_set_default(point_size: int = 13) -> None:
 
     loaded_families: List[str] = []
 
-    for fname in candidates:
-        try:
-            with asset_path("fonts", fname) as fpath:
-                if fpath.exists():
-                    fid = QFontDatabase.addApplicationFont(str(fpath))
-                    if fid != -1:
-                        fams = QFontDatabase.applicationFontFamilies(fid)
-                        loaded_families.extend(list(fams))
-        except Exception:
-            # Silencioso: si falla, seguimos con fallback del sistema
-            pass
+    try:
+        # la carpeta se resuelve una sola vez, no por candidato
+        with asset_path("fonts") as fonts_dir:
+            for fname in candidates:
+                fpath = fonts_dir / fname
+                if not fpath.exists():
+                    continue
+                fid = QFontDatabase.addApplicationFont(str(fpath))
+                if fid != -1:
+                    loaded_families.extend(
+                        QFontDatabase.applicationFontFamilies(fid))
+                    # cada archivo es su propia familia y solo se usa la primera
+                    if loaded_families:
+                        break
+    except Exception:
+        # Silencioso: si falla, seguimos con fallback del sistema
+        pass
 
     # Elige la primera familia válida que haya entrado
     family = loaded_families[0] if loaded_families else None
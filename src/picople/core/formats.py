@@ -1,18 +1,42 @@
 # src/picople/core/formats.py
-IMAGE_EXTS = {
+from os.path import splitext as _splitext
+from typing import Dict, List, Optional
+
+IMAGE_EXTS = frozenset({
     ".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp",
     ".heic", ".heif"
-}
-VIDEO_EXTS = {
+})
+VIDEO_EXTS = frozenset({
     ".mp4", ".m4v", ".mov", ".avi", ".mkv", ".webm", ".3gp"
-}
+})
 ALL_EXTS = IMAGE_EXTS | VIDEO_EXTS
 
+# extensión -> tipo: una consulta al dict en vez de dos `in`
+_EXT_KIND: Dict[str, str] = {
+    **{e: "image" for e in IMAGE_EXTS},
+    **{e: "video" for e in VIDEO_EXTS},
+}
+
+
+def _ext(path: str) -> str:
+    # splitext solo mira la cola; lower() sobre el sufijo, no la ruta entera
+    return _splitext(path)[1].lower()
+
 
 def is_image(path: str) -> bool:
-    return (path.lower().rsplit(".", 1)[-1] if "." in path else "").rjust(0) or \
-           ("." + path.lower().rsplit(".", 1)[-1]) in IMAGE_EXTS
+    return _ext(path) in IMAGE_EXTS
 
 
 def is_video(path: str) -> bool:
-    return ("." + path.lower().rsplit(".", 1)[-1]) in VIDEO_EXTS
+    return _ext(path) in VIDEO_EXTS
+
+
+def classify(path: str) -> Optional[str]:
+    """'image' | 'video' | None con una sola extracción de extensión."""
+    return _EXT_KIND.get(_ext(path))
+
+
+def classify_batch(paths: List[str]) -> List[Optional[str]]:
+    """classify() sobre una lista completa (p. ej. los archivos de una carpeta)."""
+    get = _EXT_KIND.get
+    return [get(_splitext(p)[1].lower()) for p in paths]
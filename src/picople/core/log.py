@@ -1,7 +1,7 @@
 # src/picople/core/log.py
 from __future__ import annotations
 import sys
-from datetime import datetime
+import time
 
 # Mapea algunos Unicode comunes a ASCII
 _SAFE_MAP = str.maketrans({
@@ -16,20 +16,40 @@ _SAFE_MAP = str.maketrans({
     "–": "-",
 })
 
+# resuelto una vez; stdout puede ser None (pythonw) → getattr
+_ENC = getattr(sys.stdout, "encoding", None) or "utf-8"
+
+
+# "[HH:MM:SS." ya codificado; solo cambia una vez por segundo
+_last_sec = -1
+_prefix = b""
+
+
+def _stamp() -> bytes:
+    # [HH:MM:SS.mmm] sin datetime/strftime
+    global _last_sec, _prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _last_sec:
+        lt = time.localtime(sec)
+        _prefix = f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.".encode("ascii")
+        _last_sec = sec
+    return _prefix + b"%03d]" % int((t - sec) * 1000)
+
 
 def _timestamp() -> str:
-    # [HH:MM:SS.mmm]
-    return datetime.now().strftime("[%H:%M:%S.%f]")[:-3]
+    return _stamp().decode("ascii")
 
 
 def log(*parts) -> None:
     try:
-        msg = " ".join(str(p) for p in parts).translate(_SAFE_MAP)
-        enc = sys.stdout.encoding or "utf-8"
-        sys.stdout.buffer.write(_timestamp().encode(enc, errors="replace"))
-        sys.stdout.buffer.write(b" ")
-        sys.stdout.buffer.write(msg.encode(enc, errors="replace"))
-        sys.stdout.buffer.write(b"\n")
+        msg = " ".join(map(str, parts))
+        if not msg.isascii():
+            # la mayoría de líneas son ASCII puro: no hace falta translate
+            msg = msg.translate(_SAFE_MAP)
+        # una sola escritura (un lock de stdout) por línea
+        line = f" {msg}\n".encode(_ENC, errors="replace")
+        sys.stdout.buffer.write(_stamp() + line)
         sys.stdout.flush()
     except Exception:
         # Último recurso: que no crashee jamás por loggear
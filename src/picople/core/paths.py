@@ -1,17 +1,41 @@
 # src/picople/core/paths.py
 from __future__ import annotations
 from pathlib import Path
+from typing import Optional
 from PySide6.QtCore import QStandardPaths
 
+# Directorios ya creados: el mkdir (stat+mkdir) se hace solo la primera vez
+_APP_DATA: Optional[Path] = None
+_THUMBS: Optional[Path] = None
+_THUMB_CACHE: Optional[Path] = None
+
 
 def app_data_dir() -> Path:
-    base = Path(QStandardPaths.writableLocation(
-        QStandardPaths.AppDataLocation))
-    base.mkdir(parents=True, exist_ok=True)
-    return base
+    global _APP_DATA
+    if _APP_DATA is None:
+        base = Path(QStandardPaths.writableLocation(
+            QStandardPaths.AppDataLocation))
+        base.mkdir(parents=True, exist_ok=True)
+        _APP_DATA = base
+    return _APP_DATA
 
 
 def thumbs_dir() -> Path:
-    d = app_data_dir() / "thumbs"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    global _THUMBS
+    if _THUMBS is None:
+        d = app_data_dir() / "thumbs"
+        d.mkdir(parents=True, exist_ok=True)
+        _THUMBS = d
+    return _THUMBS
+
+
+def thumb_cache_dir() -> Path:
+    # caché regenerable (XDG ~/.cache en Linux), separada de los datos del app
+    global _THUMB_CACHE
+    if _THUMB_CACHE is None:
+        base = Path(QStandardPaths.writableLocation(
+            QStandardPaths.CacheLocation))
+        d = base / "thumbs"
+        d.mkdir(parents=True, exist_ok=True)
+        _THUMB_CACHE = d
+    return _THUMB_CACHE
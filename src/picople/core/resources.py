@@ -1,20 +1,53 @@
 # src/picople/core/resources.py
 from __future__ import annotations
 from contextlib import contextmanager
+from functools import lru_cache
 from importlib.resources import files, as_file
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Optional, Tuple
 
+# Bases resueltas una vez (files() recorre los finders de importlib)
+try:
+    _PKG_BASE = files("picople") / "assets"
+except Exception:
+    _PKG_BASE = None
+_REPO_BASE = Path.cwd() / "assets"
 
-def _existing(p: Path) -> Path | None:
-    return p if p.exists() else None
 
-
-def _alts_for_parts(parts: Tuple[str, ...]) -> Iterable[Tuple[str, ...]]:
+def _alts_for_parts(parts: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
     # Si te pasan ("favicon", "favicon.ico"), prueba también ("icons", "favicon.ico")
     if parts and parts[0].lower() == "favicon":
-        yield ("icons", *parts[1:])
-    yield parts
+        return (("icons", *parts[1:]), parts)
+    return (parts,)
+
+
+@lru_cache(maxsize=256)
+def _resolve(parts_t: Tuple[str, ...]) -> Optional[Path]:
+    """
+    Cadena de prioridad memoizada: un stat por clave y ejecución.
+    None si el asset vive en un paquete no extraído (zip): ahí as_file
+    da un temporal válido solo dentro del `with`, no se puede cachear.
+    """
+    alts = _alts_for_parts(parts_t)
+
+    # 1) Paquete (instalable / distribuible)
+    if _PKG_BASE is not None:
+        try:
+            for alt in alts:
+                cand = _PKG_BASE.joinpath(*alt)
+                if cand.is_file() or cand.is_dir():
+                    return cand if isinstance(cand, Path) else None
+        except Exception:
+            pass
+
+    # 2) Repo raíz (asumiendo ejecución desde el proyecto)
+    for alt in alts:
+        cand = _REPO_BASE.joinpath(*alt)
+        if cand.exists():
+            return cand
+
+    # 3) Fallback: ruta esperada en ./assets (aunque no exista aún)
+    return _REPO_BASE.joinpath(*parts_t)
 
 
 @contextmanager
@@ -28,25 +61,16 @@ def asset_path(*parts: str):
     Si no existe en ningún lado, devuelve la ruta "esperada" en ./assets/<parts...>.
     """
     parts_t = tuple(parts)
+    resolved = _resolve(parts_t)
+    if resolved is not None:
+        yield resolved
+        return
 
-    # 1) Paquete (instalable / distribuible)
-    try:
-        pkg_base = files("picople") / "assets"
-        for alt in _alts_for_parts(parts_t):
-            with as_file(pkg_base.joinpath(*alt)) as p:
-                if p.exists():
-                    yield Path(p)
-                    return
-    except Exception:
-        pass
-
-    # 2) Repo raíz (asumiendo ejecución desde el proyecto)
-    cwd = Path.cwd()
+    # paquete comprimido: extracción temporal en cada uso
     for alt in _alts_for_parts(parts_t):
-        cand = _existing(cwd / "assets" / Path(*alt))
-        if cand:
-            yield cand
+        cand = _PKG_BASE.joinpath(*alt)
+        if cand.is_file() or cand.is_dir():
+            with as_file(cand) as p:
+                yield Path(p)
             return
-
-    # 3) Fallback: ruta esperada en ./assets (aunque no exista aún)
-    yield cwd / "assets" / Path(*parts_t)
+    yield _REPO_BASE.joinpath(*parts_t)
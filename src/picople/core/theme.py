@@ -2,6 +2,7 @@
 # File: src/picople/core/theme.py
 # ─────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
+import re
 
 # src/picople/core/theme.py
 
@@ -112,6 +113,8 @@ QLabel { color: #111827; }
 QToolBar#MainToolbar { border-bottom: 1px solid rgba(0,0,0,0.05); }
 QSlider#MediaSlider::groove:horizontal { height:6px; background:#e1e5ea; border-radius:3px; }
 QSlider#MediaSlider::handle:horizontal { width:12px; margin:-4px 0; border-radius:6px; background:#3b77ff; }
+QLabel#FaceTile { background: rgba(0,0,0,0.04); border-radius: 6px; }
+#ViewerOverlay { background-color: rgba(0,0,0,180); }
 """
 
 QSS_DARK = """
@@ -221,5 +224,24 @@ QLabel { color: #e5e7eb; }
 QToolBar#MainToolbar { border-bottom: 1px solid #172036; }
 QSlider#MediaSlider::groove:horizontal { height:6px; background:#2a2c31; border-radius:3px; }
 QSlider#MediaSlider::handle:horizontal { width:12px; margin:-4px 0; border-radius:6px; background:#6aa0ff; }
+QLabel#FaceTile { background: rgba(255,255,255,0.06); border-radius: 6px; }
 QLabel#AlbumHeaderTitle { color: palette(text); font-weight: 600; font-size: 16px; }
+#ViewerOverlay { background-color: rgba(0,0,0,180); }
 """
+
+
+# ---- Versiones compactas (se calculan una vez al importar) ----
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};])\s*")
+
+
+def _minify(qss: str) -> str:
+    """Quita comentarios y espacios sobrantes: menos entrada para el parser de Qt."""
+    qss = _COMMENT_RE.sub("", qss)
+    qss = _SPACE_RE.sub(" ", qss)
+    return _PUNCT_RE.sub(r"\1", qss).strip()
+
+
+QSS_LIGHT_MIN = _minify(QSS_LIGHT)
+QSS_DARK_MIN = _minify(QSS_DARK)
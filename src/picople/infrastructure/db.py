@@ -1,7 +1,9 @@
 from __future__ import annotations
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 
 _sqlcipher_mod = None
 try:
@@ -17,6 +19,64 @@ class DBError(RuntimeError):
     pass
 
 
+# SQL de las consultas calientes: texto idéntico en cada llamada, así la
+# caché de sentencias del conector (por texto) reutiliza el prepare/plan
+_SQL = {
+    "upsert_media": """
+        INSERT INTO media(path, kind, mtime, size, thumb_path)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(path) DO UPDATE SET
+            kind=excluded.kind,
+            mtime=excluded.mtime,
+            size=excluded.size,
+            thumb_path=excluded.thumb_path;
+    """,
+    "update_media": "UPDATE media SET kind=?, mtime=?, size=?, thumb_path=? WHERE path=?;",
+    "insert_media": "INSERT INTO media(path, kind, mtime, size, thumb_path) VALUES (?, ?, ?, ?, ?);",
+    "set_favorite": "UPDATE media SET favorite=? WHERE path=?;",
+    "is_favorite": "SELECT favorite FROM media WHERE path=?;",
+    "get_media_id": "SELECT id FROM media WHERE path=?;",
+    "set_album_cover": "UPDATE albums SET cover_path=? WHERE id=?;",
+}
+
+_MEDIA_COLS = "m.path, m.kind, m.mtime, m.size, m.thumb_path, m.favorite"
+
+
+@lru_cache(maxsize=64)
+def _media_query(select: str, has_kind: bool, has_search: bool, favorites_only: bool,
+                 has_album: bool, order_by: Optional[str]) -> str:
+    """SQL de listado/conteo según qué filtros vienen (los valores van como parámetros)."""
+    where = []
+    if has_kind:
+        where.append("m.kind=?")
+    if has_search:
+        where.append("(m.path LIKE ?)")
+    if favorites_only:
+        where.append("m.favorite=1")
+    if has_album:
+        where.append("am.album_id=?")
+
+    sql = f"SELECT {select} FROM media m"
+    if has_album:
+        sql += " JOIN album_media am ON am.media_id = m.id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if order_by:
+        sql += f" ORDER BY m.{order_by} LIMIT ? OFFSET ?"
+    return sql
+
+
+def _media_params(kind: Optional[str], search: Optional[str], album_id: Optional[int]) -> list:
+    params: list = []
+    if kind:
+        params.append(kind)
+    if search:
+        params.append(f"%{search}%")
+    if album_id is not None:
+        params.append(album_id)
+    return params
+
+
 class Database:
     """
     Gestor de DB cifrada con SQLCipher.
@@ -30,6 +90,7 @@ class Database:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.conn = None
+        self._in_tx = False
 
     @property
     def is_open(self) -> bool:
@@ -79,6 +140,34 @@ class Database:
             self.conn.close()
             self.conn = None
 
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa varias escrituras en un solo commit:
+            with db.transaction():
+                for p in paths: db.set_favorite(p, True)
+        Si algo falla, rollback. Anidado: se une a la transacción exterior.
+        """
+        if self._in_tx:
+            yield
+            return
+        if not getattr(self.conn, "in_transaction", False):
+            self.conn.execute("BEGIN;")
+        self._in_tx = True
+        try:
+            yield
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_tx = False
+
+    def _autocommit(self, autocommit: bool) -> None:
+        # dentro de transaction() el commit lo hace el bloque
+        if autocommit and not self._in_tx:
+            self.conn.commit()
+
     # -------------------- Schema & migraciones -------------------- #
     def _ensure_schema(self) -> None:
         cur = self.conn.cursor()
@@ -155,35 +244,55 @@ class Database:
 
     # -------------------- Media UPSERT -------------------- #
     def upsert_media(self, path: str, kind: str, mtime: int, size: int, thumb_path: Optional[str]) -> None:
+        self.upsert_media_many([(path, kind, mtime, size, thumb_path)])
+
+    def upsert_media_many(self, rows: Iterable[Tuple[str, str, int, int, Optional[str]]]) -> None:
+        """
+        UPSERT de muchas filas (path, kind, mtime, size, thumb_path) en UNA
+        transacción: un executemany y un solo commit (un fsync) por lote.
+        Dentro de una transacción ya abierta (transaction() o implícita) no
+        hace commit ni rollback: solo deshace su propio lote (SAVEPOINT).
+        """
+        rows = list(rows)
+        if not rows:
+            return
         cur = self.conn.cursor()
+        owns_tx = not self._in_tx and not getattr(self.conn, "in_transaction", False)
+        if owns_tx:
+            cur.execute("BEGIN IMMEDIATE;")
+        cur.execute("SAVEPOINT upsert_media;")
         try:
-            cur.execute("""
-                    INSERT INTO media(path, kind, mtime, size, thumb_path)
-                    VALUES (?, ?, ?, ?, ?)
-                    ON CONFLICT(path) DO UPDATE SET
-                        kind=excluded.kind,
-                        mtime=excluded.mtime,
-                        size=excluded.size,
-                        thumb_path=excluded.thumb_path;
-                """, (path, kind, mtime, size, thumb_path))
-        except Exception:
-            cur.execute("UPDATE media SET kind=?, mtime=?, size=?, thumb_path=? WHERE path=?;",
-                        (kind, mtime, size, thumb_path, path))
-            if cur.rowcount == 0:
-                cur.execute("INSERT INTO media(path, kind, mtime, size, thumb_path) VALUES (?, ?, ?, ?, ?);",
-                            (path, kind, mtime, size, thumb_path))
-        self.conn.commit()
+            try:
+                cur.executemany(_SQL["upsert_media"], rows)
+            except Exception:
+                # SQLite sin ON CONFLICT (o fila inválida): fila a fila, mismo lote
+                cur.execute("ROLLBACK TO upsert_media;")
+                for path, kind, mtime, size, thumb_path in rows:
+                    cur.execute(_SQL["update_media"],
+                                (kind, mtime, size, thumb_path, path))
+                    if cur.rowcount == 0:
+                        cur.execute(_SQL["insert_media"],
+                                    (path, kind, mtime, size, thumb_path))
+        except BaseException:
+            # el lote no queda a medias; lo previo del llamador se conserva
+            cur.execute("ROLLBACK TO upsert_media;")
+            cur.execute("RELEASE upsert_media;")
+            if owns_tx:
+                self.conn.rollback()
+            raise
+        cur.execute("RELEASE upsert_media;")
+        if owns_tx:
+            self.conn.commit()
 
     # -------------------- Favoritos -------------------- #
-    def set_favorite(self, path: str, fav: bool) -> None:
+    def set_favorite(self, path: str, fav: bool, *, autocommit: bool = True) -> None:
         cur = self.conn.cursor()
-        cur.execute("UPDATE media SET favorite=? WHERE path=?;",
-                    (1 if fav else 0, path))
-        self.conn.commit()
+        cur.execute(_SQL["set_favorite"], (1 if fav else 0, path))
+        self._autocommit(autocommit)
 
     def is_favorite(self, path: str) -> bool:
         cur = self.conn.cursor()
-        cur.execute("SELECT favorite FROM media WHERE path=?;", (path,))
+        cur.execute(_SQL["is_favorite"], (path,))
         row = cur.fetchone()
         return bool(row and row[0])
 
@@ -197,25 +306,9 @@ class Database:
         album_id: Optional[int] = None
     ) -> int:
         cur = self.conn.cursor()
-        where = []
-        params: list = []
-        if kind:
-            where.append("m.kind=?")
-            params.append(kind)
-        if search:
-            where.append("(m.path LIKE ?)")
-            params.append(f"%{search}%")
-        if favorites_only:
-            where.append("m.favorite=1")
-        if album_id is not None:
-            where.append("am.album_id=?")
-            params.append(album_id)
-
-        sql = "SELECT COUNT(*) FROM media m"
-        if album_id is not None:
-            sql += " JOIN album_media am ON am.media_id = m.id"
-        if where:
-            sql += " WHERE " + " AND ".join(where)
+        sql = _media_query("COUNT(*)", bool(kind), bool(search), favorites_only,
+                           album_id is not None, None)
+        params = _media_params(kind, search, album_id)
         cur.execute(sql, params)
         row = cur.fetchone()
         return int(row[0]) if row else 0
@@ -232,26 +325,9 @@ class Database:
         album_id: Optional[int] = None
     ) -> list[dict]:
         cur = self.conn.cursor()
-        where = []
-        params: list = []
-        if kind:
-            where.append("m.kind=?")
-            params.append(kind)
-        if search:
-            where.append("(m.path LIKE ?)")
-            params.append(f"%{search}%")
-        if favorites_only:
-            where.append("m.favorite=1")
-        if album_id is not None:
-            where.append("am.album_id=?")
-            params.append(album_id)
-
-        sql = "SELECT m.path, m.kind, m.mtime, m.size, m.thumb_path, m.favorite FROM media m"
-        if album_id is not None:
-            sql += " JOIN album_media am ON am.media_id = m.id"
-        if where:
-            sql += " WHERE " + " AND ".join(where)
-        sql += f" ORDER BY m.{order_by} LIMIT ? OFFSET ?"
+        sql = _media_query(_MEDIA_COLS, bool(kind), bool(search), favorites_only,
+                           album_id is not None, order_by)
+        params = _media_params(kind, search, album_id)
         params.extend([limit, offset])
         cur.execute(sql, params)
         rows = cur.fetchall()
@@ -292,15 +368,14 @@ class Database:
             "thumb_path": r[4], "favorite": bool(r[5])
         } for r in rows]
 
-    def set_album_cover(self, album_id: int, cover_path: Optional[str]) -> None:
+    def set_album_cover(self, album_id: int, cover_path: Optional[str], *, autocommit: bool = True) -> None:
         cur = self.conn.cursor()
-        cur.execute("UPDATE albums SET cover_path=? WHERE id=?;",
-                    (cover_path, album_id))
-        self.conn.commit()
+        cur.execute(_SQL["set_album_cover"], (cover_path, album_id))
+        self._autocommit(autocommit)
 
     def _get_media_id(self, path: str) -> Optional[int]:
         cur = self.conn.cursor()
-        cur.execute("SELECT id FROM media WHERE path=?;", (path,))
+        cur.execute(_SQL["get_media_id"], (path,))
         r = cur.fetchone()
         return int(r[0]) if r else None
 
@@ -314,21 +389,23 @@ class Database:
             rp = Path(r)
             n.append(str(rp.resolve()).replace(
                 "\\", "/").lower().rstrip("/") + "/")
+        # más larga primero: el primer match es la raíz más específica
+        n.sort(key=len, reverse=True)
         return n
 
     def _folder_key_from_path(self, abs_path: str, nroots: List[str]) -> Optional[str]:
         """
         Devuelve la ruta relativa del directorio contenedor (carpeta del álbum)
         tomando la RAÍZ MÁS LARGA que haga match (para raíces superpuestas).
-        Normaliza a minúsculas y '/'.
+        Normaliza a minúsculas y '/'. `nroots` viene de _roots_normalized().
         """
-        pnorm = str(Path(abs_path).resolve()).replace("\\", "/").lower()
-        base_match = None
-        best_len = -1
-        for base in nroots:
-            if pnorm.startswith(base) and len(base) > best_len:
-                base_match = base
-                best_len = len(base)
+        # el scanner guarda rutas absolutas: basta normalizar el texto;
+        # resolve() (stat por fila) solo si no cae bajo ninguna raíz
+        pnorm = abs_path.replace("\\", "/").lower()
+        base_match = next((b for b in nroots if pnorm.startswith(b)), None)
+        if base_match is None:
+            pnorm = str(Path(abs_path).resolve()).replace("\\", "/").lower()
+            base_match = next((b for b in nroots if pnorm.startswith(b)), None)
         if base_match is None:
             return None
         rel = pnorm[len(base_match):]
@@ -343,32 +420,6 @@ class Database:
         titled = [p[:1].upper() + p[1:] if p else p for p in parts]
         return " - ".join(titled) if titled else "(Sin título)"
 
-    def _get_or_create_album_by_key(self, folder_key: str, default_title: str) -> int:
-        cur = self.conn.cursor()
-        # 1) ¿ya existe por folder_key?
-        cur.execute("SELECT id FROM albums WHERE folder_key=?;", (folder_key,))
-        row = cur.fetchone()
-        if row:
-            return int(row[0])
-
-        # 2) Compatibilidad: ¿álbum antiguo con título autogenerado?
-        cur.execute(
-            "SELECT id, folder_key FROM albums WHERE title=?;", (default_title,))
-        row = cur.fetchone()
-        if row:
-            aid = int(row[0])
-            if row[1] is None:
-                cur.execute(
-                    "UPDATE albums SET folder_key=? WHERE id=?;", (folder_key, aid))
-                self.conn.commit()
-            return aid
-
-        # 3) Crear uno nuevo
-        cur.execute("INSERT INTO albums(title, folder_key) VALUES(?, ?);",
-                    (default_title, folder_key))
-        self.conn.commit()
-        return int(cur.lastrowid)
-
     def rename_album(self, album_id: int, new_title: str) -> None:
         cur = self.conn.cursor()
         cur.execute("UPDATE albums SET title=? WHERE id=?;",
@@ -423,6 +474,8 @@ class Database:
         """
         Autogenera álbumes a partir de la **carpeta** del media (llave estable folder_key),
         sin alterar títulos existentes. Completa folder_key cuando falte.
+        Resuelve fila a fila (mismo orden que siempre) contra álbumes y vínculos
+        cargados en memoria; las escrituras van en lote al final.
         """
         cur = self.conn.cursor()
         cur.execute("SELECT id, path, thumb_path FROM media;")
@@ -430,45 +483,77 @@ class Database:
 
         nroots = self._roots_normalized(roots)
 
-        for mid, mpath, mthumb in rows:
-            folder_key = self._folder_key_from_path(mpath, nroots)
-            if not folder_key:
-                continue
-
-            default_title = self._default_title_from_folder_key(folder_key)
+        # Estado actual en memoria (orden de id/rowid, como lo verían las consultas)
+        cur.execute("SELECT id, title, folder_key, cover_path FROM albums ORDER BY id;")
+        album_key: dict[int, Optional[str]] = {}
+        album_cover: dict[int, Optional[str]] = {}
+        by_key: dict[str, int] = {}
+        by_title: dict[str, int] = {}
+        for aid, title, fkey, cover in cur.fetchall():
+            album_key[aid] = fkey
+            album_cover[aid] = cover
+            if fkey is not None:
+                by_key.setdefault(fkey, aid)
+            by_title.setdefault(title, aid)
+
+        # álbum de cada media: "WHERE media_id=? LIMIT 1" recorre el índice de la
+        # PK (album_id, media_id), o sea devuelve el de menor album_id
+        cur.execute("SELECT media_id, MIN(album_id) FROM album_media GROUP BY media_id;")
+        first_link: dict[int, int] = dict(cur.fetchall())
+
+        key_updates: dict[int, str] = {}
+        cover_updates: dict[int, str] = {}
+        links: list[tuple[int, int]] = []
+
+        def set_key(aid: int, folder_key: str) -> None:
+            # una llave por álbum y un álbum por llave (índice único)
+            if album_key.get(aid) is None and folder_key not in by_key:
+                album_key[aid] = folder_key
+                by_key[folder_key] = aid
+                key_updates[aid] = folder_key
+
+        with self.transaction():
+            for mid, mpath, mthumb in rows:
+                folder_key = self._folder_key_from_path(mpath, nroots)
+                if not folder_key:
+                    continue
 
-            # Si la media ya está en algún álbum, reutiliza ese álbum y completa folder_key si falta
-            cur.execute(
-                "SELECT album_id FROM album_media WHERE media_id=? LIMIT 1;", (mid,))
-            link = cur.fetchone()
-            if link:
-                album_id = int(link[0])
-                cur.execute(
-                    "SELECT folder_key FROM albums WHERE id=?;", (album_id,))
-                fkey = cur.fetchone()
-                if fkey and fkey[0] is None:
-                    cur.execute(
-                        "UPDATE albums SET folder_key=? WHERE id=?;", (folder_key, album_id))
-                    self.conn.commit()
-            else:
-                album_id = self._get_or_create_album_by_key(
-                    folder_key, default_title)
-
-            # vincula media -> álbum
-            cur.execute("""
+                # Si la media ya está en algún álbum, reutiliza ese álbum y completa folder_key si falta
+                album_id = first_link.get(mid)
+                if album_id is not None:
+                    set_key(album_id, folder_key)
+                else:
+                    album_id = by_key.get(folder_key)
+                    if album_id is None:
+                        # Compatibilidad: ¿álbum antiguo con título autogenerado?
+                        default_title = self._default_title_from_folder_key(folder_key)
+                        album_id = by_title.get(default_title)
+                        if album_id is not None:
+                            set_key(album_id, folder_key)
+                        else:
+                            cur.execute("INSERT INTO albums(title, folder_key) VALUES(?, ?);",
+                                        (default_title, folder_key))
+                            album_id = int(cur.lastrowid)
+                            album_key[album_id] = folder_key
+                            album_cover[album_id] = None
+                            by_key[folder_key] = album_id
+                            by_title[default_title] = album_id
+
+                links.append((album_id, mid))
+
+                # portada por defecto si no tiene
+                if album_cover.get(album_id) is None and mthumb:
+                    album_cover[album_id] = mthumb
+                    cover_updates[album_id] = mthumb
+
+            cur.executemany("UPDATE albums SET folder_key=? WHERE id=?;",
+                            [(k, aid) for aid, k in key_updates.items()])
+            cur.executemany("""
                     INSERT OR IGNORE INTO album_media(album_id, media_id, position)
                     VALUES (?, ?, 0);
-                """, (album_id, mid))
-
-            # portada por defecto si no tiene
-            cur.execute(
-                "SELECT cover_path FROM albums WHERE id=?;", (album_id,))
-            cover = cur.fetchone()
-            if cover and (cover[0] is None) and mthumb:
-                cur.execute(
-                    "UPDATE albums SET cover_path=? WHERE id=?;", (mthumb, album_id))
-
-        self.conn.commit()
+                """, links)
+            cur.executemany("UPDATE albums SET cover_path=? WHERE id=?;",
+                            [(c, aid) for aid, c in cover_updates.items()])
 
         # Pasada extra para unir duplicados residuales
         self.dedupe_albums_by_folder_key()
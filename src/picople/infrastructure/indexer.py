@@ -2,13 +2,14 @@
 from __future__ import annotations
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
-from picople.core.formats import IMAGE_EXTS, VIDEO_EXTS
+from picople.core.formats import classify_batch
 from picople.core.paths import thumbs_dir
 from picople.infrastructure.thumbs import image_thumb, video_thumb
+from picople.infrastructure.thumb_cache import prune_thumb_cache
 from picople.infrastructure.db import Database
 from picople.core.log import log
 
@@ -20,6 +21,8 @@ class IndexerWorker(QObject):
     error = Signal(str, str)              # path, error
     finished = Signal(dict)               # resumen
 
+    DB_BATCH = 500                        # filas por transacción
+
     def __init__(
         self,
         roots: List[str],
@@ -40,8 +43,28 @@ class IndexerWorker(QObject):
     def cancel(self) -> None:
         self._cancel = True
 
-    def _collect_files(self) -> List[Path]:
-        files: List[Path] = []
+    def _flush_rows(self, db: Database, rows: List[tuple]) -> int:
+        """Escribe el lote y lo vacía. Devuelve cuántas filas fallaron."""
+        if not rows:
+            return 0
+        failed = 0
+        try:
+            db.upsert_media_many(rows)
+        except Exception:
+            # el lote se deshizo entero: fila a fila para no perder las buenas
+            # y reportar cada fallo con su ruta
+            for row in rows:
+                try:
+                    db.upsert_media(*row)
+                except Exception as e:
+                    self.error.emit(row[0], str(e))
+                    failed += 1
+        rows.clear()
+        return failed
+
+    def _collect_files(self) -> List[Tuple[Path, str]]:
+        """(ruta, "image" | "video") de cada medio bajo las raíces, sin repetidos."""
+        files: List[Tuple[Path, str]] = []
         seen: set[str] = set()
         for root in self.roots:
             if not root.exists():
@@ -49,13 +72,13 @@ class IndexerWorker(QObject):
                 self.info.emit(msg)
                 continue
             for dirpath, _dirnames, filenames in os.walk(root):
-                for fn in filenames:
-                    p = Path(dirpath) / fn
-                    ext = p.suffix.lower()
-                    if ext in IMAGE_EXTS or ext in VIDEO_EXTS:
+                # clasifica la carpeta entera de una vez; Path solo para medios
+                for fn, kind in zip(filenames, classify_batch(filenames)):
+                    if kind is not None:
+                        p = Path(dirpath) / fn
                         key = str(p.resolve())
                         if key not in seen:
-                            files.append(p)
+                            files.append((p, kind))
                             seen.add(key)
         return files
 
@@ -83,16 +106,17 @@ class IndexerWorker(QObject):
             counts = {"total": total, "images": 0,
                       "videos": 0, "thumbs_ok": 0, "thumbs_fail": 0}
 
-            for i, p in enumerate(files, start=1):
+            # filas para la DB: se escriben por lotes (un commit por lote)
+            pending: List[tuple] = []
+
+            for i, (p, kind) in enumerate(files, start=1):
                 if self._cancel:
                     self.info.emit("Indexación cancelada.")
                     break
                 try:
-                    ext = p.suffix.lower()
                     st = p.stat()
                     mtime = int(st.st_mtime)
                     size = int(st.st_size)
-                    kind = "image" if ext in IMAGE_EXTS else "video"
 
                     thumb_file = None
                     if kind == "image":
@@ -115,8 +139,10 @@ class IndexerWorker(QObject):
                                 counts["thumbs_fail"] += 1
 
                     if local_db and local_db.is_open:
-                        local_db.upsert_media(
-                            str(p), kind, mtime, size, thumb_file)
+                        pending.append(
+                            (str(p), kind, mtime, size, thumb_file))
+                        if len(pending) >= self.DB_BATCH:
+                            counts["thumbs_fail"] += self._flush_rows(local_db, pending)
                         # Nota: si necesitas auditar, descomenta esta línea:
                         # log("Indexer: DB upsert:", {"path": str(p), "kind": kind, "thumb": thumb_file is not None})
 
@@ -126,6 +152,12 @@ class IndexerWorker(QObject):
                 finally:
                     self.progress.emit(i, total, str(p))
 
+            if local_db and local_db.is_open:
+                counts["thumbs_fail"] += self._flush_rows(local_db, pending)
+            # sidecars de originales editados/movidos: la caché no crece sin límite
+            pruned = prune_thumb_cache()
+            if pruned:
+                log("Indexer: sidecars de miniaturas borrados:", pruned)
             self.finished.emit(counts)
 
         except Exception as e:
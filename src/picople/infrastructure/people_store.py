@@ -509,34 +509,6 @@ class PeopleStore:
                     (1 if hidden else 0, face_id))
         self._conn.commit()
 
-    def accept_suggestion(self, face_id: int, person_id: int) -> None:
-        cur = self._conn.cursor()
-        cur.execute("""
-            INSERT INTO person_face(person_id, face_id)
-            VALUES (?, ?)
-            ON CONFLICT(face_id) DO UPDATE SET person_id=excluded.person_id;
-        """, (person_id, face_id))
-        cur.execute("""
-            UPDATE face_suggestions
-               SET state = CASE
-                               WHEN person_id=? THEN 'accepted'
-                               ELSE 'rejected'
-                           END
-             WHERE face_id=?;
-        """, (person_id, face_id))
-        self._conn.commit()
-
-        self.ensure_cover_if_missing(person_id)
-        self.link_face_to_person(person_id, face_id)
-
-    def reject_suggestion(self, face_id: int, person_id: int) -> None:
-        cur = self._conn.cursor()
-        cur.execute("""
-            UPDATE face_suggestions SET state='rejected'
-            WHERE face_id=? AND person_id=?;
-        """, (face_id, person_id))
-        self._conn.commit()
-
     # ------------------------------------------------------------------ #
     # Escaneo incremental
     # ------------------------------------------------------------------ #
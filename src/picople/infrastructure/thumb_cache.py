@@ -0,0 +1,233 @@
+# src/picople/infrastructure/thumb_cache.py
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import shiboken6
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+from picople.core.paths import thumb_cache_dir
+from picople.core.log import log
+
+CACHE_FORMAT = "WEBP"
+CACHE_QUALITY = 80
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def thumb_cache_path(src: str, size: int, *, crop: bool = True) -> Optional[Path]:
+    """
+    Ruta del sidecar para (src, mtime, tamaño, modo). None si src no existe.
+    El mtime va en la llave: si el original cambia, el sidecar viejo queda huérfano.
+    """
+    try:
+        st = os.stat(src)
+    except OSError:
+        return None
+    key = f"{src}\0{st.st_mtime_ns}\0{int(size)}\0{int(crop)}"
+    digest = hashlib.sha1(key.encode("utf-8", errors="ignore")).hexdigest()
+    return thumb_cache_dir() / f"{digest}.webp"
+
+
+def _scaled_size(src_size: QSize, size: int, crop: bool) -> QSize:
+    mode = Qt.KeepAspectRatioByExpanding if crop else Qt.KeepAspectRatio
+    return src_size.scaled(size, size, mode)
+
+
+def load_scaled_thumb(src: Optional[str], size: int, *, crop: bool = True,
+                      persist: bool = True) -> QImage:
+    """
+    Devuelve `src` escalado a size×size (crop=True cubre el cuadro, crop=False cabe dentro).
+    Primero busca el sidecar en disco; si no existe, decodifica ya escalado con
+    QImageReader.setScaledSize y escribe el sidecar de forma atómica.
+    persist=False no usa sidecar (para fuentes que ya son miniaturas pequeñas).
+    Usa QImage (no QPixmap), así que puede llamarse fuera del hilo GUI.
+    Devuelve una QImage nula si no se pudo leer.
+    """
+    if not src:
+        return QImage()
+
+    cache = None
+    if persist:
+        cache = thumb_cache_path(src, size, crop=crop)
+        if cache is None:
+            return QImage()
+    if cache is not None and cache.exists():
+        img = QImage(str(cache))
+        if not img.isNull():
+            # marca de uso: prune_thumb_cache borra primero lo menos usado
+            try:
+                os.utime(cache)
+            except OSError:
+                pass
+            return img
+
+    reader = QImageReader(src)
+    reader.setAutoTransform(True)
+    src_size = reader.size()
+    if src_size.isValid():
+        reader.setScaledSize(_scaled_size(src_size, size, crop))
+    img = reader.read()
+    if img.isNull():
+        return img
+    if not src_size.isValid():
+        # el formato no soporta escalado en lectura: escalamos aquí
+        target = _scaled_size(img.size(), size, crop)
+        img = img.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    if cache is None:
+        return img
+
+    # tmp por hilo: dos workers pueden escribir el mismo sidecar a la vez
+    tmp = cache.with_name(f"{cache.name}.{threading.get_ident()}.tmp")
+    try:
+        if img.save(str(tmp), CACHE_FORMAT, CACHE_QUALITY):
+            os.replace(tmp, cache)
+    except OSError as e:
+        log("thumb_cache: no se pudo escribir", cache, e)
+    finally:
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+    return img
+
+
+def prune_thumb_cache(max_bytes: int = CACHE_MAX_BYTES) -> int:
+    """
+    Recorta los sidecars a max_bytes, borrando primero los de mtime más viejo.
+    Los de originales editados o movidos ya no se leen (su llave cambió), así
+    que terminan saliendo por aquí. Recorre el directorio: fuera del hilo GUI.
+    Devuelve cuántos archivos se borraron.
+    """
+    entries: List[Tuple[float, int, str]] = []
+    total = 0
+    try:
+        with os.scandir(thumb_cache_dir()) as it:
+            for e in it:
+                if not e.name.endswith(".webp"):
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+                total += st.st_size
+    except OSError as e:
+        log("thumb_cache: no se pudo recorrer la caché", e)
+        return 0
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+# ---- carga asíncrona ----
+
+class _ThumbTask(QRunnable):
+    """Decodifica una miniatura en el pool (solo QImage fuera del hilo GUI)."""
+
+    def __init__(self, loader: "ThumbLoader", key: str, src: str, size: int, crop: bool,
+                 persist: bool = True):
+        super().__init__()
+        self._loader = loader
+        self._key = key
+        self._src = src
+        self._size = size
+        self._crop = crop
+        self._persist = persist
+
+    def run(self):
+        img = load_scaled_thumb(self._src, self._size, crop=self._crop,
+                                persist=self._persist)
+        # el loader vive en el hilo GUI: la señal llega encolada
+        self._loader._done.emit(self._key, img)
+
+
+class ThumbLoader(QObject):
+    """
+    Miniaturas en QThreadPool; entrega QPixmap en el hilo GUI y los guarda en
+    QPixmapCache, así que reabrir una vista es una búsqueda en memoria.
+    """
+    _done = Signal(str, QImage)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._pool = QThreadPool.globalInstance()
+        # llave -> [(receptor, slot)] esperando esa miniatura
+        self._waiting: Dict[str, List[Tuple[QObject, Callable[[QPixmap], None]]]] = {}
+        self._done.connect(self._on_done)
+
+    @staticmethod
+    def cache_key(src: str, size: int, crop: bool, mtime: Optional[int] = None) -> str:
+        # el mtime invalida la entrada si la miniatura se regenera en la misma ruta;
+        # si el llamador ya lo conoce (p. ej. de la BD) no se toca el disco
+        if mtime is None:
+            try:
+                mtime = os.stat(src).st_mtime_ns
+            except OSError:
+                mtime = 0
+        return f"thumb:{src}:{mtime}:{int(size)}:{int(crop)}"
+
+    def request(
+        self,
+        src: str,
+        size: int,
+        receiver: QObject,
+        slot: Callable[[QPixmap], None],
+        *,
+        crop: bool = True,
+        persist: bool = True,
+        mtime: Optional[int] = None,
+    ) -> Optional[QPixmap]:
+        """
+        Devuelve el QPixmap si ya está en caché; si no, encola la decodificación
+        y llama a slot(pixmap) al terminar (mientras receiver siga vivo).
+        persist=False: sin sidecar en disco (ver load_scaled_thumb).
+        mtime: versión conocida de src; sin él se hace os.stat en cada llamada.
+        """
+        key = self.cache_key(src, size, crop, mtime)
+        pm = QPixmapCache.find(key)
+        if pm is not None:
+            return pm
+        pending = self._waiting.get(key)
+        if pending is not None:
+            pending.append((receiver, slot))
+            return None
+        self._waiting[key] = [(receiver, slot)]
+        self._pool.start(_ThumbTask(self, key, src, size, crop, persist))
+        return None
+
+    def _on_done(self, key: str, img: QImage):
+        waiting = self._waiting.pop(key, [])
+        pm = QPixmap.fromImage(img)
+        if not pm.isNull():
+            QPixmapCache.insert(key, pm)
+        for receiver, slot in waiting:
+            if shiboken6.isValid(receiver):
+                slot(pm)
+
+
+_LOADER: Optional[ThumbLoader] = None
+
+
+def thumb_loader() -> ThumbLoader:
+    """Instancia compartida; créala desde el hilo GUI."""
+    global _LOADER
+    if _LOADER is None:
+        _LOADER = ThumbLoader()
+    return _LOADER
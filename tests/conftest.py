@@ -0,0 +1,17 @@
+# tests/conftest.py
+import sqlite3
+
+import pytest
+
+import picople.infrastructure.db as dbmod
+from picople.infrastructure.db import Database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # sqlite3 plano en lugar de SQLCipher: mismo SQL, sin cifrado
+    monkeypatch.setattr(dbmod, "_sqlcipher_mod", sqlite3)
+    d = Database(tmp_path / "t.db")
+    d.open("k")
+    yield d
+    d.close()
@@ -0,0 +1,44 @@
+# tests/test_db_albums.py
+def _albums(d):
+    cur = d.conn.cursor()
+    cur.execute("SELECT id, title, folder_key, cover_path FROM albums ORDER BY id;")
+    return cur.fetchall()
+
+
+def _links(d):
+    cur = d.conn.cursor()
+    cur.execute("SELECT album_id, media_id FROM album_media ORDER BY 1, 2;")
+    return cur.fetchall()
+
+
+def test_rebuild_creates_one_album_per_folder(db):
+    db.upsert_media_many([
+        ("/r/viajes/1.jpg", "image", 1, 1, "/t/1"),
+        ("/r/viajes/2.jpg", "image", 2, 1, "/t/2"),
+        ("/r/viajes/lima/3.jpg", "image", 3, 1, None),
+        ("/r/suelta.jpg", "image", 4, 1, "/t/4"),
+    ])
+    db.rebuild_albums_from_media(["/r"])
+    assert _albums(db) == [
+        (1, "Viajes", "viajes", "/t/1"),
+        (2, "Viajes - Lima", "viajes/lima", None),
+    ]
+    assert _links(db) == [(1, 1), (1, 2), (2, 3)]
+
+
+def test_rebuild_two_linked_albums_same_folder(db):
+    # dos medias de la misma carpeta, cada una ya en un álbum sin folder_key:
+    # solo uno puede quedarse la llave (índice único) y no debe fallar
+    db.upsert_media_many([
+        ("/r/fiesta/1.jpg", "image", 1, 1, None),
+        ("/r/fiesta/2.jpg", "image", 2, 1, None),
+    ])
+    cur = db.conn.cursor()
+    cur.execute("INSERT INTO albums(title) VALUES ('Uno'), ('Dos');")
+    cur.execute("INSERT INTO album_media(album_id, media_id) VALUES (1, 1), (2, 2);")
+    db.conn.commit()
+
+    db.rebuild_albums_from_media(["/r"])
+
+    assert _albums(db) == [(1, "Uno", "fiesta", None), (2, "Dos", None, None)]
+    assert _links(db) == [(1, 1), (2, 2)]
@@ -0,0 +1,40 @@
+# tests/test_db_upsert.py
+import sqlite3
+
+import pytest
+
+
+def test_upsert_many_inserts_and_updates(db):
+    db.upsert_media_many([("/a.jpg", "image", 1, 1, None)])
+    db.upsert_media_many([("/a.jpg", "image", 5, 2, "/t/a"), ("/b.mp4", "video", 1, 1, None)])
+    assert not db.conn.in_transaction
+    page = db.fetch_media_page(offset=0, limit=10)
+    assert [(m["path"], m["mtime"], m["thumb_path"]) for m in page] == [
+        ("/a.jpg", 5, "/t/a"), ("/b.mp4", 1, None)]
+
+
+def test_upsert_many_joins_open_transaction(db):
+    db.upsert_media_many([("/a.jpg", "image", 1, 1, None)])
+    with db.transaction():
+        db.set_favorite("/a.jpg", True)
+        db.upsert_media_many([("/b.jpg", "image", 1, 1, None)])
+        # no cierra la transacción del llamador
+        assert db.conn.in_transaction
+    assert db.count_media() == 2 and db.is_favorite("/a.jpg")
+
+
+def test_upsert_many_failure_keeps_caller_writes(db):
+    db.upsert_media_many([("/a.jpg", "image", 1, 1, None)])
+    with db.transaction():
+        db.set_favorite("/a.jpg", True)
+        with pytest.raises(sqlite3.IntegrityError):
+            # kind NULL viola NOT NULL: el lote entero se deshace
+            db.upsert_media_many([("/c.jpg", "image", 1, 1, None), ("/d.jpg", None, 1, 1, None)])
+    assert db.count_media() == 1 and db.is_favorite("/a.jpg")
+
+
+def test_upsert_many_failure_leaves_no_open_transaction(db):
+    with pytest.raises(sqlite3.IntegrityError):
+        db.upsert_media_many([("/e.jpg", "image", 1, 1, None), ("/f.jpg", None, 1, 1, None)])
+    assert not db.conn.in_transaction
+    assert db.count_media() == 0
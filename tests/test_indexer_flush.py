@@ -0,0 +1,17 @@
+# tests/test_indexer_flush.py
+from picople.infrastructure.indexer import IndexerWorker
+
+
+def test_flush_rows_keeps_good_rows_when_batch_fails(db):
+    w = IndexerWorker([])
+    errors = []
+    w.error.connect(lambda path, msg: errors.append(path))
+    # kind NULL viola NOT NULL: el lote falla, pero solo esa fila se pierde
+    rows = [("/a.jpg", "image", 1, 1, None), ("/b.jpg", None, 1, 1, None),
+            ("/c.mp4", "video", 1, 1, None)]
+    assert w._flush_rows(db, rows) == 1
+    assert rows == []
+    assert errors == ["/b.jpg"]
+    assert sorted(m["path"] for m in db.fetch_media_page(offset=0, limit=10)) == [
+        "/a.jpg", "/c.mp4"]
+    assert not db.conn.in_transaction
@@ -0,0 +1,25 @@
+# tests/test_thumb_cache_prune.py
+import os
+
+import picople.infrastructure.thumb_cache as tc
+
+
+def _sidecar(d, name, size, mtime):
+    p = d / name
+    p.write_bytes(b"x" * size)
+    os.utime(p, (mtime, mtime))
+    return p
+
+
+def test_prune_drops_oldest_sidecars_over_the_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(tc, "thumb_cache_dir", lambda: tmp_path)
+    old = _sidecar(tmp_path, "old.webp", 100, 1_000)
+    mid = _sidecar(tmp_path, "mid.webp", 100, 2_000)
+    new = _sidecar(tmp_path, "new.webp", 100, 3_000)
+    other = _sidecar(tmp_path, "notes.txt", 500, 0)
+
+    assert tc.prune_thumb_cache(max_bytes=300) == 0
+    assert tc.prune_thumb_cache(max_bytes=150) == 2
+    assert not old.exists() and not mid.exists()
+    # el más reciente y lo que no es sidecar se quedan
+    assert new.exists() and other.exists()